@@ -7,9 +7,46 @@ Art. 55 [nowelizacja 2006] — zasady ekstradycji.
 Art. 55 [2006 amendment] — extradition rules.
 """
 
+from collections.abc import Iterable
+
 from konstytucja.common.errors import ExtraditionError, RightsRestrictionError
 from konstytucja.common.types import ExtraditionRequest, RightsRestriction
 
+# Bit positions of the five Art. 31(3) conditions in a packed restriction.
+_BY_STATUTE = 1 << 0
+_NECESSARY = 1 << 1
+_LEGITIMATE_AIM = 1 << 2
+_PROPORTIONATE = 1 << 3
+_PRESERVES_ESSENCE = 1 << 4
+
+_ART_31_3_ALL = (1 << 5) - 1
+
+# Art. 31(3): the five cumulative conditions, in the order they are reported.
+_ART_31_3_CONDITIONS: tuple[tuple[int, str], ...] = (
+    (_BY_STATUTE, "not established by statute (ustawa)"),
+    (_NECESSARY, "not necessary in a democratic state"),
+    (_LEGITIMATE_AIM, "does not pursue a legitimate aim (security, public order, environment, "
+                      "health, public morals, or freedoms of others)"),
+    (_PROPORTIONATE, "not proportionate to the aim pursued"),
+    (_PRESERVES_ESSENCE, "violates the essence of the freedom or right"),
+)
+
+
+def _restriction_flags(restriction: RightsRestriction) -> int:
+    """Pack a restriction's five Art. 31(3) conditions into one int."""
+    return (
+        (_BY_STATUTE if restriction.by_statute else 0)
+        | (_NECESSARY if restriction.necessary_in_democratic_state else 0)
+        | (_LEGITIMATE_AIM if restriction.legitimate_aim else 0)
+        | (_PROPORTIONATE if restriction.proportionate else 0)
+        | (_PRESERVES_ESSENCE if restriction.preserves_essence else 0)
+    )
+
+
+def _restriction_failures(flags: int) -> list[str]:
+    """Reasons (in Art. 31(3) order) why packed conditions fail, empty if none."""
+    return [reason for bit, reason in _ART_31_3_CONDITIONS if not flags & bit]
+
 
 def validate_rights_restriction(restriction: RightsRestriction) -> bool:
     """Validate a proposed restriction of constitutional rights against Art. 31(3).
@@ -44,34 +81,119 @@ def validate_rights_restriction(restriction: RightsRestriction) -> bool:
     Raises:
         RightsRestrictionError: with details of which conditions fail.
     """
-    failures: list[str] = []
-
-    if not restriction.by_statute:
-        failures.append("not established by statute (ustawa)")
-    if not restriction.necessary_in_democratic_state:
-        failures.append("not necessary in a democratic state")
-    if not restriction.legitimate_aim:
-        failures.append("does not pursue a legitimate aim (security, public order, "
-                        "environment, health, public morals, or freedoms of others)")
-    if not restriction.proportionate:
-        failures.append("not proportionate to the aim pursued")
-    if not restriction.preserves_essence:
-        failures.append("violates the essence of the freedom or right")
-
-    if failures:
-        detail = "; ".join(failures)
-        raise RightsRestrictionError(
-            f"Restriction '{restriction.description}' fails Art. 31(3): {detail}",
-            article="31(3)",
-        )
+    flags = _restriction_flags(restriction)
+    if flags == _ART_31_3_ALL:
+        return True
 
-    return True
+    failures = _restriction_failures(flags)
+    detail = "; ".join(failures)
+    raise RightsRestrictionError(
+        f"Restriction '{restriction.description}' fails Art. 31(3): {detail}",
+        article="31(3)",
+    )
+
+
+def validate_rights_restriction_batch(
+    restrictions: Iterable[RightsRestriction],
+) -> list[str | None]:
+    """Screen many proposed restrictions against Art. 31(3) without raising.
+
+    Each restriction is screened with a single comparison of its packed
+    condition flags; failure reasons are only built for the restrictions
+    that actually fail.
+
+    Args:
+        restrictions: The proposed restrictions to evaluate.
+
+    Returns:
+        For each restriction, in order, the conditions it does not meet
+        (as in the validate_rights_restriction() message), or None if the
+        restriction is constitutionally valid. Every failure is under
+        Art. 31(3), so unlike validate_extradition_batch() the result names
+        the failed conditions rather than the article.
+    """
+    return [
+        None if flags == _ART_31_3_ALL else "; ".join(_restriction_failures(flags))
+        for flags in map(_restriction_flags, restrictions)
+    ]
 
 
 # ---------------------------------------------------------------------------
 # Extradition — Art. 55 [nowelizacja z 8 września 2006 r.]
 # ---------------------------------------------------------------------------
 
+_NOT_ABROAD = "act was not committed outside Polish territory (Art. 55(2)(1))"
+_NO_DOUBLE_CRIMINALITY = "act does not constitute an offence under Polish law (Art. 55(2)(2))"
+
+# Art. 55 denials as (message, article) pairs.
+_DENY_POLITICAL = (
+    "Extradition prohibited: concerns a nonviolent political offence "
+    "(przestępstwo bez użycia przemocy z przyczyn politycznych)",
+    "55(4)",
+)
+_DENY_HUMAN_RIGHTS = (
+    "Extradition prohibited: would violate human rights and freedoms "
+    "(naruszenie wolności i praw człowieka i obywatela)",
+    "55(4)",
+)
+_DENY_NO_COURT_RULING = (
+    "Extradition inadmissible: court has not ruled on admissibility "
+    "(sąd nie orzekł o dopuszczalności ekstradycji)",
+    "55(5)",
+)
+_DENY_POLISH_CITIZEN = (
+    "Extradition of a Polish citizen is prohibited "
+    "(ekstradycja obywatela polskiego jest zakazana)",
+    "55(1)",
+)
+_DENY_NOT_ABROAD = (f"Extradition of Polish citizen denied: {_NOT_ABROAD}", "55(2)")
+_DENY_NO_DOUBLE_CRIMINALITY = (
+    f"Extradition of Polish citizen denied: {_NO_DOUBLE_CRIMINALITY}",
+    "55(2)",
+)
+_DENY_NOT_ABROAD_NOR_DOUBLE_CRIMINALITY = (
+    f"Extradition of Polish citizen denied: {_NOT_ABROAD}; {_NO_DOUBLE_CRIMINALITY}",
+    "55(2)",
+)
+
+
+def _extradition_denial(request: ExtraditionRequest) -> tuple[str, str] | None:
+    """The first Art. 55 denial that applies to a request, or None if permitted."""
+    # Art. 55(4): absolute prohibitions — apply to all persons
+    if request.political_nonviolent_offense:
+        return _DENY_POLITICAL
+    if request.violates_human_rights:
+        return _DENY_HUMAN_RIGHTS
+
+    # Art. 55(5): court must approve admissibility
+    if not request.court_approved:
+        return _DENY_NO_COURT_RULING
+
+    # Non-citizens: no further constitutional restrictions
+    if not request.subject_is_polish_citizen:
+        return None
+
+    # Art. 55(3): ICC/international tribunal exception for gravest crimes
+    if (
+        request.international_judicial_body
+        and request.based_on_ratified_treaty
+        and request.genocide_or_war_crime
+    ):
+        return None
+
+    # Art. 55(1): default prohibition for Polish citizens
+    if not request.based_on_ratified_treaty:
+        return _DENY_POLISH_CITIZEN
+
+    # Art. 55(2): treaty-based extradition with conditions
+    if request.act_committed_abroad:
+        if request.double_criminality:
+            return None
+        return _DENY_NO_DOUBLE_CRIMINALITY
+    if request.double_criminality:
+        return _DENY_NOT_ABROAD
+    return _DENY_NOT_ABROAD_NOR_DOUBLE_CRIMINALITY
+
 
 def validate_extradition(request: ExtraditionRequest) -> bool:
     """Validate an extradition request against Art. 55.
@@ -144,63 +266,25 @@ def validate_extradition(request: ExtraditionRequest) -> bool:
     Raises:
         ExtraditionError: with details of which rule is violated.
     """
-    # Art. 55(4): absolute prohibitions — apply to all persons
-    if request.political_nonviolent_offense:
-        raise ExtraditionError(
-            "Extradition prohibited: concerns a nonviolent political offence "
-            "(przestępstwo bez użycia przemocy z przyczyn politycznych)",
-            article="55(4)",
-        )
+    denial = _extradition_denial(request)
+    if denial is not None:
+        raise ExtraditionError(*denial)
+    return True
 
-    if request.violates_human_rights:
-        raise ExtraditionError(
-            "Extradition prohibited: would violate human rights and freedoms "
-            "(naruszenie wolności i praw człowieka i obywatela)",
-            article="55(4)",
-        )
 
-    # Art. 55(5): court must approve admissibility
-    if not request.court_approved:
-        raise ExtraditionError(
-            "Extradition inadmissible: court has not ruled on admissibility "
-            "(sąd nie orzekł o dopuszczalności ekstradycji)",
-            article="55(5)",
-        )
-
-    # Non-citizens: no further constitutional restrictions
-    if not request.subject_is_polish_citizen:
-        return True
+def validate_extradition_batch(requests: Iterable[ExtraditionRequest]) -> list[str | None]:
+    """Screen many extradition requests against Art. 55 without raising.
 
-    # Art. 55(3): ICC/international tribunal exception for gravest crimes
-    if (
-        request.international_judicial_body
-        and request.based_on_ratified_treaty
-        and request.genocide_or_war_crime
-    ):
-        return True
+    Each request goes through the same early-exit rules as
+    validate_extradition(), without building an exception for denials.
 
-    # Art. 55(2): treaty-based extradition with conditions
-    if request.based_on_ratified_treaty:
-        failures: list[str] = []
-        if not request.act_committed_abroad:
-            failures.append(
-                "act was not committed outside Polish territory (Art. 55(2)(1))"
-            )
-        if not request.double_criminality:
-            failures.append(
-                "act does not constitute an offence under Polish law (Art. 55(2)(2))"
-            )
-        if failures:
-            detail = "; ".join(failures)
-            raise ExtraditionError(
-                f"Extradition of Polish citizen denied: {detail}",
-                article="55(2)",
-            )
-        return True
+    Args:
+        requests: The extradition requests to evaluate.
 
-    # Art. 55(1): default prohibition for Polish citizens
-    raise ExtraditionError(
-        "Extradition of a Polish citizen is prohibited "
-        "(ekstradycja obywatela polskiego jest zakazana)",
-        article="55(1)",
-    )
+    Returns:
+        For each request, in order, the violated article (e.g. "55(4)"),
+        or None if the extradition is constitutionally permissible. Use
+        validate_extradition() to get the full reason for a denial.
+    """
+    denials = (_extradition_denial(r) for r in requests)
+    return [None if denial is None else denial[1] for denial in denials]
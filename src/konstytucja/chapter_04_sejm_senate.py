@@ -6,7 +6,10 @@ Eligibility, bill passage, chamber competences, immunity,
 incompatibility of offices, national referendum.
 """
 
+from collections.abc import Iterable
 from datetime import date
+from functools import lru_cache
+from typing import Final
 
 from konstytucja.common.errors import (
     EligibilityError,
@@ -26,19 +29,19 @@ from konstytucja.common.voting import passes_vote
 # Composition (Art. 95–98)
 # ---------------------------------------------------------------------------
 
-SEJM_DEPUTIES: int = 460
+SEJM_DEPUTIES: Final[int] = 460
 """Art. 96 ust. 1: Sejm składa się z 460 posłów.
 
 The Sejm consists of 460 Deputies.
 """
 
-SENATE_SENATORS: int = 100
+SENATE_SENATORS: Final[int] = 100
 """Art. 97 ust. 1: Senat składa się z 100 senatorów.
 
 The Senate consists of 100 Senators.
 """
 
-SEJM_TERM_YEARS: int = 4
+SEJM_TERM_YEARS: Final[int] = 4
 """Art. 98 ust. 1: Sejm i Senat są wybierane na czteroletnie kadencje.
 
 The Sejm and Senate are elected for 4-year terms.
@@ -74,10 +77,18 @@ w administracji rządowej.
 A Deputy's mandate may not be held jointly with the above offices.
 """
 
+_INCOMPATIBLE_OFFICES: frozenset[str] = frozenset(INCOMPATIBLE_WITH_DEPUTY)
+
 # ---------------------------------------------------------------------------
 # Eligibility (Art. 99)
 # ---------------------------------------------------------------------------
 
+_NOT_POLISH_CITIZEN = "must be a Polish citizen"
+_ART_99_3_CONVICTION = (
+    "convicted by final judgment for an intentional crime prosecuted "
+    "ex officio (Art. 99(3), nowelizacja 2009)"
+)
+
 
 def check_sejm_eligibility(citizen: Citizen, election_date: date) -> bool:
     """Verify eligibility for the Sejm (Art. 99 ust. 1, 3).
@@ -103,24 +114,22 @@ def check_sejm_eligibility(citizen: Citizen, election_date: date) -> bool:
     - No criminal conviction for intentional crime prosecuted ex officio
       (Art. 99(3), 2009 amendment)
     """
-    errors: list[str] = []
+    age = citizen.age_at(election_date)
+    if citizen.polish_citizen and not citizen.criminal_record and age >= 21:
+        return True
 
+    errors: list[str] = []
     if not citizen.polish_citizen:
-        errors.append("must be a Polish citizen")
-    if citizen.age_at(election_date) < 21:
-        errors.append(f"must be at least 21 (is {citizen.age_at(election_date)})")
+        errors.append(_NOT_POLISH_CITIZEN)
+    if age < 21:
+        errors.append(f"must be at least 21 (is {age})")
     if citizen.criminal_record:
-        errors.append(
-            "convicted by final judgment for an intentional crime prosecuted "
-            "ex officio (Art. 99(3), nowelizacja 2009)"
-        )
+        errors.append(_ART_99_3_CONVICTION)
 
-    if errors:
-        raise EligibilityError(
-            f"{citizen.name} ineligible for Sejm: {'; '.join(errors)}",
-            article="99(1)",
-        )
-    return True
+    raise EligibilityError(
+        f"{citizen.name} ineligible for Sejm: {'; '.join(errors)}",
+        article="99(1)",
+    )
 
 
 def check_senate_eligibility(citizen: Citizen, election_date: date) -> bool:
@@ -139,24 +148,63 @@ def check_senate_eligibility(citizen: Citizen, election_date: date) -> bool:
     imprisonment by a final judgment for an intentional crime prosecuted
     ex officio may not be elected to the Sejm or the Senate.
     """
-    errors: list[str] = []
+    age = citizen.age_at(election_date)
+    if citizen.polish_citizen and not citizen.criminal_record and age >= 30:
+        return True
 
+    errors: list[str] = []
     if not citizen.polish_citizen:
-        errors.append("must be a Polish citizen")
-    if citizen.age_at(election_date) < 30:
-        errors.append(f"must be at least 30 (is {citizen.age_at(election_date)})")
+        errors.append(_NOT_POLISH_CITIZEN)
+    if age < 30:
+        errors.append(f"must be at least 30 (is {age})")
     if citizen.criminal_record:
-        errors.append(
-            "convicted by final judgment for an intentional crime prosecuted "
-            "ex officio (Art. 99(3), nowelizacja 2009)"
-        )
+        errors.append(_ART_99_3_CONVICTION)
 
-    if errors:
-        raise EligibilityError(
-            f"{citizen.name} ineligible for Senate: {'; '.join(errors)}",
-            article="99(2)",
-        )
-    return True
+    raise EligibilityError(
+        f"{citizen.name} ineligible for Senate: {'; '.join(errors)}",
+        article="99(2)",
+    )
+
+
+def _latest_birth_date(election_date: date, min_age: int) -> date:
+    """Latest date of birth at which a person is min_age on election_date."""
+    try:
+        return election_date.replace(year=election_date.year - min_age)
+    except ValueError:  # election on 29 February, cutoff year not a leap year
+        return date(election_date.year - min_age, 2, 28)
+
+
+def _eligible(citizens: Iterable[Citizen], election_date: date, min_age: int) -> list[bool]:
+    cutoff = _latest_birth_date(election_date, min_age)
+    return [
+        c.polish_citizen and not c.criminal_record and c.date_of_birth <= cutoff
+        for c in citizens
+    ]
+
+
+def check_sejm_eligibility_batch(citizens: Iterable[Citizen], election_date: date) -> list[bool]:
+    """Screen many candidates for Sejm eligibility (Art. 99 ust. 1, 3).
+
+    Applies the same conditions as check_sejm_eligibility(), but compares
+    each date of birth against a single cutoff date computed once for the
+    election instead of computing every candidate's age.
+
+    Returns:
+        For each citizen, in order, whether they are eligible.
+        Use check_sejm_eligibility() to get the reasons for a rejection.
+    """
+    return _eligible(citizens, election_date, 21)
+
+
+def check_senate_eligibility_batch(
+    citizens: Iterable[Citizen], election_date: date
+) -> list[bool]:
+    """Screen many candidates for Senate eligibility (Art. 99 ust. 2, 3).
+
+    Batch counterpart of check_senate_eligibility(); see
+    check_sejm_eligibility_batch().
+    """
+    return _eligible(citizens, election_date, 30)
 
 
 # ---------------------------------------------------------------------------
@@ -173,7 +221,7 @@ def sejm_passes_bill(vote: VoteRecord) -> bool:
     Art. 120: The Sejm shall pass bills by a simple majority vote, in the
     presence of at least half the statutory number of Deputies.
     """
-    assert vote.chamber == Chamber.SEJM, "Vote must be from the Sejm"
+    assert vote.chamber is Chamber.SEJM, "Vote must be from the Sejm"
     return passes_vote(vote, MajorityType.SIMPLE)
 
 
@@ -188,7 +236,7 @@ def senate_passes_bill(vote: VoteRecord) -> bool:
     proposed in a Senate resolution, shall be considered accepted unless the
     Sejm rejects it by an absolute majority vote.
     """
-    assert vote.chamber == Chamber.SENATE, "Vote must be from the Senate"
+    assert vote.chamber is Chamber.SENATE, "Vote must be from the Senate"
     return passes_vote(vote, MajorityType.SIMPLE)
 
 
@@ -197,7 +245,7 @@ def sejm_overrides_senate(vote: VoteRecord) -> bool:
 
     Art. 121 ust. 3: requires absolute majority in the Sejm to override.
     """
-    assert vote.chamber == Chamber.SEJM, "Override vote must be from the Sejm"
+    assert vote.chamber is Chamber.SEJM, "Override vote must be from the Sejm"
     return passes_vote(vote, MajorityType.ABSOLUTE)
 
 
@@ -206,6 +254,17 @@ def sejm_overrides_senate(vote: VoteRecord) -> bool:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=64)
+def _incompatibility_message(office: str) -> str | None:
+    """Art. 103 violation message for an office, or None if compatible."""
+    if office in _INCOMPATIBLE_OFFICES:
+        return (
+            f"A parliamentary mandate cannot be held jointly with the office "
+            f"of '{office}'."
+        )
+    return None
+
+
 def check_incompatibility(office: str) -> bool:
     """Check whether an office is incompatible with a parliamentary mandate.
 
@@ -220,12 +279,9 @@ def check_incompatibility(office: str) -> bool:
     Raises:
         IncompatibilityError: If the office is incompatible with a mandate.
     """
-    if office in INCOMPATIBLE_WITH_DEPUTY:
-        raise IncompatibilityError(
-            f"A parliamentary mandate cannot be held jointly with the office "
-            f"of '{office}'.",
-            article="103",
-        )
+    message = _incompatibility_message(office)
+    if message is not None:
+        raise IncompatibilityError(message, article="103")
     return True
 
 
@@ -234,6 +290,18 @@ def check_incompatibility(office: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
+_IMMUNITY_MESSAGES: dict[Chamber, str] = {
+    Chamber.SEJM: (
+        "Criminal prosecution requires consent of the Sejm. "
+        "Immunity protects the member until consent is granted."
+    ),
+    Chamber.SENATE: (
+        "Criminal prosecution requires consent of the Senate. "
+        "Immunity protects the member until consent is granted."
+    ),
+}
+
+
 def validate_parliamentary_immunity(
     chamber: Chamber,
     consent_given: bool,
@@ -258,12 +326,7 @@ def validate_parliamentary_immunity(
         ImmunityError: If prosecution is attempted without consent.
     """
     if not consent_given:
-        chamber_name = "Sejm" if chamber == Chamber.SEJM else "Senate"
-        raise ImmunityError(
-            f"Criminal prosecution requires consent of the {chamber_name}. "
-            f"Immunity protects the member until consent is granted.",
-            article="105",
-        )
+        raise ImmunityError(_IMMUNITY_MESSAGES[chamber], article="105")
     return True
 
 
@@ -314,8 +377,9 @@ def validate_referendum(
 
     total_votes = votes_for + votes_against
 
-    # Art. 125(3): binding only if turnout > 50%
-    if total_votes * 2 <= eligible_voters:
+    # Art. 125(3): binding only if turnout > 50%, i.e. total_votes * 2 >
+    # eligible_voters, which for integers is total_votes > eligible_voters // 2
+    if total_votes <= eligible_voters >> 1:
         raise ReferendumError(
             f"Referendum not binding: turnout {total_votes}/{eligible_voters} "
             f"does not exceed 50%.",
@@ -329,3 +393,25 @@ def validate_referendum(
         )
 
     return True
+
+
+def validate_referendum_batch(
+    votes_for: Iterable[int],
+    votes_against: Iterable[int],
+    eligible_voters: Iterable[int],
+) -> list[bool]:
+    """Score many referendum results against Art. 125 without raising.
+
+    The three sequences are read in parallel and must have equal length.
+
+    Returns:
+        For each referendum, in order, whether it is binding (Art. 125(3))
+        and passed. A non-positive number of eligible voters counts as not
+        binding. Use validate_referendum() to get the reason for a failure.
+    """
+    return [
+        eligible > 0 and for_ + against > eligible >> 1 and for_ > against
+        for for_, against, eligible in zip(
+            votes_for, votes_against, eligible_voters, strict=True
+        )
+    ]
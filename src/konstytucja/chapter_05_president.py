@@ -30,8 +30,20 @@ MAX_PRESIDENTIAL_TERMS: int = 2
 May be re-elected only once (maximum 2 consecutive terms).
 """
 
+_TERM_LIMIT_MSG = (
+    f"A President may serve at most {MAX_PRESIDENTIAL_TERMS} "
+    f"consecutive terms (Art. 127(2)). "
+)
+
 # Art. 127 ust. 3: minimum 100,000 citizen signatures to register
 MIN_SIGNATURES: int = 100_000
+_MIN_SIGNATURES_STR = f"{MIN_SIGNATURES:,}"
+
+_NOT_POLISH_CITIZEN = "must be a Polish citizen"
+_LACKS_ELECTORAL_RIGHTS = (
+    "lacks full electoral rights: convicted by final judgment for an "
+    "intentional crime prosecuted ex officio (Art. 99(3), nowelizacja 2009)"
+)
 
 
 def check_presidential_eligibility(
@@ -64,28 +76,31 @@ def check_presidential_eligibility(
     - Full electoral rights (no Art. 99(3) disqualification)
     - At least 100,000 supporting signatures
     """
-    errors: list[str] = []
+    age = citizen.age_at(election_date)
+    if (
+        citizen.polish_citizen
+        and not citizen.criminal_record
+        and signatures >= MIN_SIGNATURES
+        and age >= 35
+    ):
+        return True
 
+    errors: list[str] = []
     if not citizen.polish_citizen:
-        errors.append("must be a Polish citizen")
-    if citizen.age_at(election_date) < 35:
-        errors.append(f"must be at least 35 (is {citizen.age_at(election_date)})")
+        errors.append(_NOT_POLISH_CITIZEN)
+    if age < 35:
+        errors.append(f"must be at least 35 (is {age})")
     if citizen.criminal_record:
-        errors.append(
-            "lacks full electoral rights: convicted by final judgment for an "
-            "intentional crime prosecuted ex officio (Art. 99(3), nowelizacja 2009)"
-        )
+        errors.append(_LACKS_ELECTORAL_RIGHTS)
     if signatures < MIN_SIGNATURES:
         errors.append(
-            f"needs at least {MIN_SIGNATURES:,} signatures (has {signatures:,})"
+            f"needs at least {_MIN_SIGNATURES_STR} signatures (has {signatures:,})"
         )
 
-    if errors:
-        raise EligibilityError(
-            f"{citizen.name} ineligible for presidency: {'; '.join(errors)}",
-            article="127(3)",
-        )
-    return True
+    raise EligibilityError(
+        f"{citizen.name} ineligible for presidency: {'; '.join(errors)}",
+        article="127(3)",
+    )
 
 
 def president_signs_bill() -> bool:
@@ -127,7 +142,7 @@ def sejm_overrides_veto(vote: VoteRecord) -> bool:
 
     Requires: 3/5 majority in the Sejm with quorum.
     """
-    assert vote.chamber == Chamber.SEJM, "Veto override vote must be from the Sejm"
+    assert vote.chamber is Chamber.SEJM, "Veto override vote must be from the Sejm"
     return passes_vote(vote, MajorityType.THREE_FIFTHS)
 
 
@@ -156,9 +171,7 @@ def validate_presidential_term(consecutive_terms_served: int) -> bool:
     """
     if consecutive_terms_served >= MAX_PRESIDENTIAL_TERMS:
         raise EligibilityError(
-            f"A President may serve at most {MAX_PRESIDENTIAL_TERMS} "
-            f"consecutive terms (Art. 127(2)). "
-            f"Already served: {consecutive_terms_served}.",
+            f"{_TERM_LIMIT_MSG}Already served: {consecutive_terms_served}.",
             article="127(2)",
         )
     return True
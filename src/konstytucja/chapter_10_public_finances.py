@@ -9,8 +9,12 @@ from decimal import Decimal
 from konstytucja.common.errors import CentralBankError, DebtCeilingError
 from konstytucja.common.types import PublicDebt
 
-# Art. 216 ust. 5: 3/5 ratio expressed as Decimal for precision
-DEBT_CEILING_RATIO = Decimal("3") / Decimal("5")  # 0.6
+# Art. 216 ust. 5: 3/5 ratio expressed as Decimal for precision.
+# Operands are kept as Decimal so checks skip int -> Decimal conversion.
+_THREE = Decimal(3)
+_FIVE = Decimal(5)
+_ZERO = Decimal(0)
+DEBT_CEILING_RATIO = _THREE / _FIVE  # 0.6
 
 
 def check_debt_ceiling(state: PublicDebt) -> bool:
@@ -47,7 +51,7 @@ def check_debt_ceiling(state: PublicDebt) -> bool:
         )
 
     # Integer-style comparison: debt * 5 > gdp * 3 means violation
-    if state.debt * 5 > state.gdp * 3:
+    if state.debt * _FIVE > state.gdp * _THREE:
         ratio = state.debt / state.gdp
         raise DebtCeilingError(
             f"Public debt ({state.debt}) exceeds 3/5 of GDP ({state.gdp}): "
@@ -66,7 +70,7 @@ def remaining_capacity(state: PublicDebt) -> Decimal:
     """
     ceiling = state.gdp * DEBT_CEILING_RATIO
     remaining = ceiling - state.debt
-    return max(remaining, Decimal("0"))
+    return max(remaining, _ZERO)
 
 
 def debt_ratio(state: PublicDebt) -> Decimal:
@@ -104,7 +104,7 @@ class AmendmentProcess:
                 f"Cannot hold Sejm vote from stage {self.stage.name}",
                 article="235(4)",
             )
-        assert vote.chamber == Chamber.SEJM
+        assert vote.chamber is Chamber.SEJM
         try:
             passes_vote(vote, MajorityType.TWO_THIRDS)
         except (QuorumError, MajorityError):
@@ -123,7 +123,7 @@ class AmendmentProcess:
                 f"Cannot hold Senate vote from stage {self.stage.name}",
                 article="235(4)",
             )
-        assert vote.chamber == Chamber.SENATE
+        assert vote.chamber is Chamber.SENATE
         try:
             passes_vote(vote, MajorityType.ABSOLUTE)
         except (QuorumError, MajorityError):
@@ -54,6 +54,7 @@ from konstytucja.common.types import (
     TribunalVerdict,
     TribunalVerdictType,
     VoteRecord,
+    ages_at,
 )
 from konstytucja.common.voting import check_majority, check_quorum, passes_vote
 
@@ -106,6 +107,7 @@ __all__ = [
     "TribunalVerdict",
     "TribunalVerdictType",
     "VoteRecord",
+    "ages_at",
     "check_majority",
     "check_quorum",
     "passes_vote",
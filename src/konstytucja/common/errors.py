@@ -5,6 +5,15 @@ Every violation of a constitutional rule raises a typed exception
 that references the specific article being violated.
 """
 
+import sys
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _prefix(article: str | None) -> str:
+    """Message prefix citing the article, e.g. "Art. 55(4): "."""
+    return f"Art. {article}: " if article else ""
+
 
 class ConstitutionalError(Exception):
     """Base exception for all constitutional violations.
@@ -12,10 +21,18 @@ class ConstitutionalError(Exception):
     Bazowy wyjątek dla wszystkich naruszeń konstytucyjnych.
     """
 
+    __slots__ = ("article",)
+
     def __init__(self, message: str, article: str | None = None):
-        self.article = article
-        prefix = f"Art. {article}: " if article else ""
-        super().__init__(f"{prefix}{message}")
+        # Interned so errors citing the same article share one string and
+        # can be matched by identity.
+        self.article = sys.intern(article) if article else article
+        super().__init__(_prefix(self.article) + message)
+
+    def __reduce__(self) -> tuple[object, ...]:
+        # BaseException pickles only its __dict__ (notes, ad-hoc attributes),
+        # which does not hold the slot.
+        return type(self), self.args, {**self.__dict__, "article": self.article}
 
 
 class QuorumError(ConstitutionalError):
@@ -25,10 +42,14 @@ class QuorumError(ConstitutionalError):
     w obecności co najmniej połowy ustawowej liczby posłów.
     """
 
+    __slots__ = ()
+
 
 class MajorityError(ConstitutionalError):
     """Wymagana większość nieosiągnięta — required majority not reached."""
 
+    __slots__ = ()
+
 
 class EligibilityError(ConstitutionalError):
     """Niespełnienie warunków wybieralności — eligibility criteria not met.
@@ -36,6 +57,8 @@ class EligibilityError(ConstitutionalError):
     Art. 99 (Sejm/Senate), Art. 127 (President).
     """
 
+    __slots__ = ()
+
 
 class LegalHierarchyError(ConstitutionalError):
     """Naruszenie hierarchii źródeł prawa — legal hierarchy violation.
@@ -43,6 +66,8 @@ class LegalHierarchyError(ConstitutionalError):
     Art. 87–94: Konstytucja is the supreme law.
     """
 
+    __slots__ = ()
+
 
 class DebtCeilingError(ConstitutionalError):
     """Przekroczenie limitu długu publicznego — public debt ceiling exceeded.
@@ -52,6 +77,8 @@ class DebtCeilingError(ConstitutionalError):
     przekroczy 3/5 wartości rocznego produktu krajowego brutto.
     """
 
+    __slots__ = ()
+
 
 class EmergencyPowerError(ConstitutionalError):
     """Naruszenie zasad stanu nadzwyczajnego — emergency power violation.
@@ -59,6 +86,8 @@ class EmergencyPowerError(ConstitutionalError):
     Art. 228–234.
     """
 
+    __slots__ = ()
+
 
 class AmendmentError(ConstitutionalError):
     """Naruszenie procedury zmiany Konstytucji — amendment procedure violation.
@@ -66,6 +95,8 @@ class AmendmentError(ConstitutionalError):
     Art. 235.
     """
 
+    __slots__ = ()
+
 
 class LegislativeProcessError(ConstitutionalError):
     """Naruszenie procesu legislacyjnego — legislative process violation.
@@ -73,6 +104,8 @@ class LegislativeProcessError(ConstitutionalError):
     Art. 118–122.
     """
 
+    __slots__ = ()
+
 
 class RightsRestrictionError(ConstitutionalError):
     """Nieproporcjonalne ograniczenie praw — disproportionate rights restriction.
@@ -81,6 +114,8 @@ class RightsRestrictionError(ConstitutionalError):
     wolności i praw mogą być ustanawiane tylko w ustawie…
     """
 
+    __slots__ = ()
+
 
 class GovernmentFormationError(ConstitutionalError):
     """Naruszenie procedury tworzenia rządu — government formation violation.
@@ -88,6 +123,8 @@ class GovernmentFormationError(ConstitutionalError):
     Art. 154–155.
     """
 
+    __slots__ = ()
+
 
 class NoConfidenceError(ConstitutionalError):
     """Naruszenie zasad wotum nieufności — no-confidence vote violation.
@@ -95,6 +132,8 @@ class NoConfidenceError(ConstitutionalError):
     Art. 158–159.
     """
 
+    __slots__ = ()
+
 
 class LocalGovernmentError(ConstitutionalError):
     """Naruszenie zasad samorządu terytorialnego — local government violation.
@@ -102,6 +141,8 @@ class LocalGovernmentError(ConstitutionalError):
     Art. 163–172.
     """
 
+    __slots__ = ()
+
 
 class OversightError(ConstitutionalError):
     """Naruszenie zasad organów kontroli — oversight organ violation.
@@ -109,6 +150,8 @@ class OversightError(ConstitutionalError):
     Art. 202–215.
     """
 
+    __slots__ = ()
+
 
 class JudicialError(ConstitutionalError):
     """Naruszenie niezależności sądów — judicial independence violation.
@@ -116,6 +159,8 @@ class JudicialError(ConstitutionalError):
     Art. 173–187.
     """
 
+    __slots__ = ()
+
 
 class IncompatibilityError(ConstitutionalError):
     """Naruszenie zakazu łączenia stanowisk — incompatibility of offices.
@@ -123,6 +168,8 @@ class IncompatibilityError(ConstitutionalError):
     Art. 103: Mandatu posła nie można łączyć z funkcją…
     """
 
+    __slots__ = ()
+
 
 class ImmunityError(ConstitutionalError):
     """Naruszenie immunitetu parlamentarnego — parliamentary immunity violation.
@@ -130,6 +177,8 @@ class ImmunityError(ConstitutionalError):
     Art. 105.
     """
 
+    __slots__ = ()
+
 
 class ReferendumError(ConstitutionalError):
     """Naruszenie zasad referendum — referendum violation.
@@ -137,6 +186,8 @@ class ReferendumError(ConstitutionalError):
     Art. 125.
     """
 
+    __slots__ = ()
+
 
 class StateTribunalError(ConstitutionalError):
     """Naruszenie zasad Trybunału Stanu — State Tribunal violation.
@@ -144,6 +195,8 @@ class StateTribunalError(ConstitutionalError):
     Art. 198–201.
     """
 
+    __slots__ = ()
+
 
 class CentralBankError(ConstitutionalError):
     """Naruszenie niezależności banku centralnego — central bank independence violation.
@@ -151,6 +204,8 @@ class CentralBankError(ConstitutionalError):
     Art. 227.
     """
 
+    __slots__ = ()
+
 
 class TribunalError(ConstitutionalError):
     """Naruszenie zasad Trybunału Konstytucyjnego — Constitutional Tribunal violation.
@@ -158,6 +213,8 @@ class TribunalError(ConstitutionalError):
     Art. 188–197.
     """
 
+    __slots__ = ()
+
 
 class ExtraditionError(ConstitutionalError):
     """Naruszenie zasad ekstradycji — extradition rule violation.
@@ -165,3 +222,5 @@ class ExtraditionError(ConstitutionalError):
     Art. 55 [zmieniony nowelizacją z 8 września 2006 r.].
     Art. 55 [amended 8 September 2006].
     """
+
+    __slots__ = ()
@@ -5,17 +5,19 @@ Typy współdzielone — enumy, dataklasy, aliasy typów.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from enum import Enum, auto
+from enum import Enum, StrEnum, auto
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Enums
 # ---------------------------------------------------------------------------
 
 
-class Chamber(Enum):
+class Chamber(StrEnum):
     """Izba parlamentu / Chamber of parliament."""
     SEJM = "Sejm"
     SENATE = "Senat"
@@ -32,7 +34,7 @@ class MajorityType(Enum):
     THREE_FIFTHS = auto() # 3/5 głosów
 
 
-class Branch(Enum):
+class Branch(StrEnum):
     """Trójpodział władzy / Separation of powers (Art. 10)."""
     LEGISLATIVE = "władza ustawodawcza"
     EXECUTIVE = "władza wykonawcza"
@@ -48,7 +50,7 @@ class LegalActType(Enum):
     LOCAL_ACT = auto()            # akt prawa miejscowego
 
 
-class EmergencyType(Enum):
+class EmergencyType(StrEnum):
     """Rodzaje stanów nadzwyczajnych / Types of emergency (Art. 228)."""
     MARTIAL_LAW = "stan wojenny"       # Art. 229
     STATE_OF_EMERGENCY = "stan wyjątkowy"  # Art. 230
@@ -65,7 +67,7 @@ class GovernmentFormationStage(Enum):
     FAILED = auto()                   # Sejm dissolved (Art. 155(2))
 
 
-class CourtType(Enum):
+class CourtType(StrEnum):
     """Rodzaje sądów / Types of courts (Art. 175)."""
     SUPREME = "Sąd Najwyższy"
     COMMON = "sądy powszechne"
@@ -73,21 +75,21 @@ class CourtType(Enum):
     MILITARY = "sądy wojskowe"
 
 
-class LocalGovernmentTier(Enum):
+class LocalGovernmentTier(StrEnum):
     """Jednostki samorządu terytorialnego / Local government tiers."""
     GMINA = "gmina"         # commune — Art. 164(1): basic unit
     POWIAT = "powiat"       # county
     WOJEWODZTWO = "województwo"  # voivodeship
 
 
-class OversightOrgan(Enum):
+class OversightOrgan(StrEnum):
     """Organy kontroli państwowej / State oversight organs (Art. 202–215)."""
     NIK = "Najwyższa Izba Kontroli"           # Art. 202–207
     RPO = "Rzecznik Praw Obywatelskich"        # Art. 208–212
     KRRIT = "Krajowa Rada Radiofonii i Telewizji"  # Art. 213–215
 
 
-class TribunalCaseType(Enum):
+class TribunalCaseType(StrEnum):
     """Types of matters the Tribunal adjudicates (Art. 188).
 
     Rodzaje spraw rozpatrywanych przez Trybunał Konstytucyjny.
@@ -98,7 +100,7 @@ class TribunalCaseType(Enum):
     PARTY_AIMS = "conformity of aims of political party with Constitution"
 
 
-class TribunalVerdictType(Enum):
+class TribunalVerdictType(StrEnum):
     """Possible outcomes of Tribunal review.
 
     Możliwe rozstrzygnięcia Trybunału Konstytucyjnego.
@@ -147,7 +149,23 @@ class AmendmentStage(Enum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def _age(born: date, on_date: date) -> int:
+    """Completed years between born and on_date (bool subtracts 0 or 1)."""
+    return on_date.year - born.year - ((on_date.month, on_date.day) < (born.month, born.day))
+
+
+def ages_at(dates_of_birth: Iterable[date], on_date: date) -> list[int]:
+    """Wiek wielu osób w dniu / Ages of many people on one date.
+
+    Equivalent to [Citizen(...).age_at(on_date) for each date of birth],
+    with the on_date fields read once for the whole roll.
+    """
+    year, month_day = on_date.year, (on_date.month, on_date.day)
+    return [year - born.year - (month_day < (born.month, born.day)) for born in dates_of_birth]
+
+
+@dataclass(frozen=True, slots=True)
 class Citizen:
     """Obywatel RP / Polish citizen."""
     name: str
@@ -160,31 +178,36 @@ class Citizen:
     @property
     def age_on(self) -> _AgeLookup:
         """Return an age-lookup helper: citizen.age_on[date]."""
-        return _AgeLookup(self.date_of_birth)
+        return _age_lookup(self.date_of_birth)
 
     def age_at(self, on_date: date) -> int:
         """Wiek w dniu / Age on a given date."""
-        born = self.date_of_birth
-        age = on_date.year - born.year
-        if (on_date.month, on_date.day) < (born.month, born.day):
-            age -= 1
-        return age
+        return _age(self.date_of_birth, on_date)
 
 
 class _AgeLookup:
     """Helper so you can write citizen.age_on[some_date]."""
 
+    __slots__ = ("_dob",)
+
     def __init__(self, dob: date):
         self._dob = dob
 
     def __getitem__(self, on_date: date) -> int:
-        age = on_date.year - self._dob.year
-        if (on_date.month, on_date.day) < (self._dob.month, self._dob.day):
-            age -= 1
-        return age
+        return _age(self._dob, on_date)
+
+
+@lru_cache(maxsize=4096)
+def _age_lookup(dob: date) -> _AgeLookup:
+    """One shared _AgeLookup per date of birth."""
+    return _AgeLookup(dob)
+
+
+# Art. 96(1), 97(1): statutory number of members per chamber
+_STATUTORY_MEMBERS: dict[Chamber, int] = {Chamber.SEJM: 460, Chamber.SENATE: 100}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoteRecord:
     """Wynik głosowania / Vote record."""
     chamber: Chamber
@@ -202,14 +225,10 @@ class VoteRecord:
         """Statutory number of members for the chamber."""
         if self.statutory_members is not None:
             return self.statutory_members
-        match self.chamber:
-            case Chamber.SEJM:
-                return 460
-            case Chamber.SENATE:
-                return 100
+        return _STATUTORY_MEMBERS[self.chamber]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bill:
     """Projekt ustawy / Legislative bill."""
     title: str
@@ -217,14 +236,14 @@ class Bill:
     urgent: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PublicDebt:
     """Stan finansów publicznych / Public finance state (Art. 216)."""
     debt: Decimal
     gdp: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmergencyDeclaration:
     """Wprowadzenie stanu nadzwyczajnego / Emergency declaration (Art. 228)."""
     emergency_type: EmergencyType
@@ -233,7 +252,7 @@ class EmergencyDeclaration:
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RightsRestriction:
     """Ograniczenie praw i wolności / Rights restriction proposal (Art. 31 ust. 3).
 
@@ -253,7 +272,7 @@ class RightsRestriction:
     preserves_essence: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TribunalVerdict:
     """Result of Constitutional Tribunal adjudication (Art. 190).
 
@@ -267,14 +286,14 @@ class TribunalVerdict:
     unconstitutional_provisions: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Minister:
     """Członek Rady Ministrów / Member of the Council of Ministers (Art. 147)."""
     name: str
     role: str  # e.g. "Prime Minister", "Minister of Finance"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CouncilOfMinisters:
     """Rada Ministrów / Council of Ministers (Art. 147).
 
@@ -286,7 +305,7 @@ class CouncilOfMinisters:
     ministers: tuple[Minister, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Judge:
     """Sędzia / Judge (Art. 179).
 
@@ -301,7 +320,7 @@ class Judge:
     krs_nominated: bool = True           # Art. 179
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocalGovernmentUnit:
     """Jednostka samorządu terytorialnego / Local government unit (Art. 164).
 
@@ -313,7 +332,7 @@ class LocalGovernmentUnit:
     term_years: int = 4  # Art. 169(2)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OversightAppointment:
     """Powołanie na stanowisko organu kontroli / Oversight organ appointment.
 
@@ -325,7 +344,7 @@ class OversightAppointment:
     senate_approved: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtraditionRequest:
     """Wniosek o ekstradycję / Extradition request (Art. 55).
 
@@ -11,6 +11,8 @@ presence of at least half the statutory number of Deputies, unless the
 Constitution provides otherwise.
 """
 
+from collections.abc import Callable
+
 from konstytucja.common.errors import MajorityError, QuorumError
 from konstytucja.common.types import MajorityType, VoteRecord
 
@@ -33,6 +35,57 @@ def check_quorum(vote: VoteRecord) -> None:
         )
 
 
+def _check_simple(vote: VoteRecord) -> None:
+    # zwykła większość: więcej za niż przeciw (abstencje nie liczą się)
+    # Simple majority: more for than against (abstentions don't count)
+    if vote.votes_for <= vote.votes_against:
+        raise MajorityError(
+            f"Simple majority not reached: {vote.votes_for} for, {vote.votes_against} against",
+            article="120",
+        )
+
+
+def _check_absolute(vote: VoteRecord) -> None:
+    # bezwzględna większość: więcej niż połowa ustawowej liczby
+    # Absolute majority: more than half the statutory members
+    # votes_for * 2 > members
+    if vote.votes_for * 2 <= vote.members:
+        raise MajorityError(
+            f"Absolute majority not reached: {vote.votes_for} for, "
+            f"need more than {vote.members // 2} "
+            f"of {vote.members} statutory members",
+            article="120",
+        )
+
+
+def _check_two_thirds(vote: VoteRecord) -> None:
+    # 2/3 głosów: votes_for * 3 >= total_present * 2
+    if vote.votes_for * 3 < vote.total_present * 2:
+        raise MajorityError(
+            f"Two-thirds majority not reached: {vote.votes_for} for "
+            f"of {vote.total_present} present",
+            article="235",
+        )
+
+
+def _check_three_fifths(vote: VoteRecord) -> None:
+    # 3/5 głosów: votes_for * 5 >= total_present * 3
+    if vote.votes_for * 5 < vote.total_present * 3:
+        raise MajorityError(
+            f"Three-fifths majority not reached: {vote.votes_for} for "
+            f"of {vote.total_present} present",
+            article="120",
+        )
+
+
+_MAJORITY_CHECKS: dict[MajorityType, Callable[[VoteRecord], None]] = {
+    MajorityType.SIMPLE: _check_simple,
+    MajorityType.ABSOLUTE: _check_absolute,
+    MajorityType.TWO_THIRDS: _check_two_thirds,
+    MajorityType.THREE_FIFTHS: _check_three_fifths,
+}
+
+
 def check_majority(vote: VoteRecord, majority_type: MajorityType) -> bool:
     """Check if a vote meets the required majority type.
 
@@ -49,51 +102,7 @@ def check_majority(vote: VoteRecord, majority_type: MajorityType) -> bool:
     Raises:
         MajorityError: if the required majority is not reached.
     """
-    match majority_type:
-        case MajorityType.SIMPLE:
-            # zwykła większość: więcej za niż przeciw (abstencje nie liczą się)
-            # Simple majority: more for than against (abstentions don't count)
-            passed = vote.votes_for > vote.votes_against
-            if not passed:
-                raise MajorityError(
-                    f"Simple majority not reached: {vote.votes_for} for, "
-                    f"{vote.votes_against} against",
-                    article="120",
-                )
-
-        case MajorityType.ABSOLUTE:
-            # bezwzględna większość: więcej niż połowa ustawowej liczby
-            # Absolute majority: more than half the statutory members
-            # votes_for * 2 > members
-            passed = vote.votes_for * 2 > vote.members
-            if not passed:
-                raise MajorityError(
-                    f"Absolute majority not reached: {vote.votes_for} for, "
-                    f"need more than {vote.members // 2} "
-                    f"of {vote.members} statutory members",
-                    article="120",
-                )
-
-        case MajorityType.TWO_THIRDS:
-            # 2/3 głosów: votes_for * 3 >= total_present * 2
-            passed = vote.votes_for * 3 >= vote.total_present * 2
-            if not passed:
-                raise MajorityError(
-                    f"Two-thirds majority not reached: {vote.votes_for} for "
-                    f"of {vote.total_present} present",
-                    article="235",
-                )
-
-        case MajorityType.THREE_FIFTHS:
-            # 3/5 głosów: votes_for * 5 >= total_present * 3
-            passed = vote.votes_for * 5 >= vote.total_present * 3
-            if not passed:
-                raise MajorityError(
-                    f"Three-fifths majority not reached: {vote.votes_for} for "
-                    f"of {vote.total_present} present",
-                    article="120",
-                )
-
+    _MAJORITY_CHECKS[majority_type](vote)
     return True
 
 
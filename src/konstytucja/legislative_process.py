@@ -71,7 +71,7 @@ class LegislativeProcess:
         Simple majority, quorum required.
         """
         self._require_stage(BillStage.SEJM_DELIBERATION, article="120")
-        assert vote.chamber == Chamber.SEJM
+        assert vote.chamber is Chamber.SEJM
         try:
             passes_vote(vote, MajorityType.SIMPLE)
         except (QuorumError, MajorityError):
@@ -103,14 +103,14 @@ class LegislativeProcess:
     def senate_amends(self, vote: VoteRecord) -> None:
         """Senate passes amendments (simple majority)."""
         self._require_stage(BillStage.SENATE_DELIBERATION, article="121(2)")
-        assert vote.chamber == Chamber.SENATE
+        assert vote.chamber is Chamber.SENATE
         passes_vote(vote, MajorityType.SIMPLE)
         self._transition(BillStage.SENATE_AMENDED, "Senate proposed amendments")
 
     def senate_rejects(self, vote: VoteRecord) -> None:
         """Senate votes to reject the bill entirely."""
         self._require_stage(BillStage.SENATE_DELIBERATION, article="121(2)")
-        assert vote.chamber == Chamber.SENATE
+        assert vote.chamber is Chamber.SENATE
         passes_vote(vote, MajorityType.SIMPLE)
         self._transition(BillStage.SENATE_REJECTED, "Senate rejected")
 
@@ -126,7 +126,7 @@ class LegislativeProcess:
             BillStage.SENATE_REJECTED,
             article="121(3)",
         )
-        assert vote.chamber == Chamber.SEJM
+        assert vote.chamber is Chamber.SEJM
         try:
             passes_vote(vote, MajorityType.ABSOLUTE)
         except (QuorumError, MajorityError):
@@ -262,7 +262,7 @@ class LegislativeProcess:
         Requires 3/5 majority with quorum.
         """
         self._require_stage(BillStage.VETOED, article="122(5)")
-        assert vote.chamber == Chamber.SEJM
+        assert vote.chamber is Chamber.SEJM
         try:
             passes_vote(vote, MajorityType.THREE_FIFTHS)
         except (QuorumError, MajorityError):
@@ -2,6 +2,8 @@
 
 from datetime import date
 from decimal import Decimal
+from pathlib import Path
+from xml.etree import ElementTree as ET
 
 import pytest
 
@@ -24,12 +26,15 @@ from konstytucja.common.types import (
     VoteRecord,
 )
 
+AKN_PATH = Path(__file__).resolve().parent.parent / "akn" / "konstytucja_rp.xml"
+AKN_NS = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"}
+
 # ---------------------------------------------------------------------------
 # Citizens
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def adult_citizen():
     """A 40-year-old Polish citizen with no criminal record."""
     return Citizen(
@@ -39,7 +44,7 @@ def adult_citizen():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def young_citizen():
     """A 20-year-old Polish citizen."""
     return Citizen(
@@ -49,7 +54,7 @@ def young_citizen():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def foreign_citizen():
     """A non-Polish citizen."""
     return Citizen(
@@ -59,7 +64,7 @@ def foreign_citizen():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def convicted_citizen():
     """A Polish citizen with a criminal record."""
     return Citizen(
@@ -75,7 +80,7 @@ def convicted_citizen():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sejm_simple_majority():
     """Sejm vote passing with simple majority and quorum."""
     return VoteRecord(
@@ -86,7 +91,7 @@ def sejm_simple_majority():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sejm_no_quorum():
     """Sejm vote without quorum."""
     return VoteRecord(
@@ -97,7 +102,7 @@ def sejm_no_quorum():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sejm_absolute_majority():
     """Sejm vote with absolute majority (> 230)."""
     return VoteRecord(
@@ -108,7 +113,7 @@ def sejm_absolute_majority():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sejm_two_thirds():
     """Sejm vote with 2/3 majority."""
     return VoteRecord(
@@ -119,7 +124,7 @@ def sejm_two_thirds():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sejm_three_fifths():
     """Sejm vote with 3/5 majority (>= 276 of 460 present)."""
     return VoteRecord(
@@ -130,7 +135,7 @@ def sejm_three_fifths():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def senate_simple_majority():
     """Senate vote with simple majority and quorum."""
     return VoteRecord(
@@ -141,7 +146,7 @@ def senate_simple_majority():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def senate_absolute_majority():
     """Senate vote with absolute majority (> 50)."""
     return VoteRecord(
@@ -249,12 +254,22 @@ def invalid_restriction():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def election_date():
     """A standard election date."""
     return date(2025, 10, 15)
 
 
+@pytest.fixture(scope="session")
+def birthday_on_election_day(election_date):
+    """Date of birth of a candidate who turns the given age on election day."""
+
+    def born(age: int) -> date:
+        return election_date.replace(year=election_date.year - age)
+
+    return born
+
+
 # ---------------------------------------------------------------------------
 # Council of Ministers (Chapter VI)
 # ---------------------------------------------------------------------------
@@ -327,3 +342,26 @@ def rpo_appointment():
         sejm_approved=True,
         senate_approved=True,
     )
+
+
+# ---------------------------------------------------------------------------
+# Akoma Ntoso XML
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def tree():
+    """The parsed AKN document, shared by every test in the session."""
+    return ET.parse(AKN_PATH)
+
+
+@pytest.fixture(scope="session")
+def root(tree):
+    """Root ``akomaNtoso`` element of the AKN document."""
+    return tree.getroot()
+
+
+@pytest.fixture(scope="session")
+def articles(root):
+    """All ``akn:article`` elements keyed by eId, collected in one tree walk."""
+    return {art.get("eId", ""): art for art in root.iterfind(".//akn:article", AKN_NS)}
@@ -2,23 +2,60 @@
 
 import re
 from pathlib import Path
-from typing import ClassVar
 from xml.etree import ElementTree as ET
 
 import pytest
-
-AKN_PATH = Path(__file__).resolve().parent.parent / "akn" / "konstytucja_rp.xml"
-NS = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"}
-
-
-@pytest.fixture(scope="module")
-def tree() -> ET.ElementTree:
-    return ET.parse(AKN_PATH)
+from conftest import AKN_NS
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src" / "konstytucja"
+XML_NS = {"xml": "http://www.w3.org/XML/1998/namespace"}
+XML_LANG = f"{{{XML_NS['xml']}}}lang"
+
+# ElementPath expressions shared by the tests below.
+ACT = "akn:act"
+META = ".//akn:meta"
+BODY = ".//akn:body"
+CHAPTERS = ".//akn:chapter"
+PARAGRAPHS = "akn:paragraph"
+PARAGRAPH_TEXT = ".//akn:p"
+ENGLISH_TEXT = ".//*[@xml:lang='en']"
+
+# Matches the ``article="N..."`` keyword in constitutional raise sites.
+ARTICLE_RE = re.compile(rb'article="(\d+)')
+
+# Articles whose AKN entry has no English translation yet.
+KNOWN_MISSING_ENGLISH = frozenset({
+    "art_4",
+    "art_8",
+    "art_121",
+    "art_230",
+    "art_232",
+})
+
+# Articles referenced in code but not yet in AKN XML.
+# As AKN coverage grows, remove from this set.
+KNOWN_MISSING_AKN = frozenset({
+    103, 105,   # chapter 04: Sejm/Senate incompatibility, immunity
+    119,        # chapter 04: legislative process
+    125,        # chapter 04: referendum
+    147, 154, 155, 156, 158, 159, 160,  # chapter 06: Council of Ministers
+    164, 169, 171,  # chapter 07: local government
+    176, 178, 179, 190, 191, 198, 199,  # chapter 08: courts
+    205, 209, 214,  # chapter 09: oversight bodies
+    227,        # chapter 10: central bank
+    233,        # chapter 11: emergency
+})
 
 
 @pytest.fixture(scope="module")
-def root(tree: ET.ElementTree) -> ET.Element:
-    return tree.getroot()
+def code_articles() -> frozenset[int]:
+    """Article numbers cited as ``article="N..."`` anywhere in the package source."""
+    found: set[int] = set()
+    for py_file in SRC_DIR.rglob("*.py"):
+        if "__pycache__" in py_file.parts:
+            continue
+        found.update(map(int, ARTICLE_RE.findall(py_file.read_bytes())))
+    return frozenset(found)
 
 
 # ---------------------------------------------------------------------------
@@ -33,22 +70,22 @@ class TestAknWellFormedness:
         assert tree is not None
 
     def test_root_is_akoma_ntoso(self, root: ET.Element) -> None:
-        assert root.tag == f"{{{NS['akn']}}}akomaNtoso"
+        assert root.tag == f"{{{AKN_NS['akn']}}}akomaNtoso"
 
     def test_act_element_exists(self, root: ET.Element) -> None:
-        act = root.find("akn:act", NS)
+        act = root.find(ACT, AKN_NS)
         assert act is not None
 
     def test_meta_section_exists(self, root: ET.Element) -> None:
-        meta = root.find(".//akn:meta", NS)
+        meta = root.find(META, AKN_NS)
         assert meta is not None
 
     def test_body_element_exists(self, root: ET.Element) -> None:
-        body = root.find(".//akn:body", NS)
+        body = root.find(BODY, AKN_NS)
         assert body is not None
 
     def test_chapters_present(self, root: ET.Element) -> None:
-        chapters = root.findall(".//akn:chapter", NS)
+        chapters = root.findall(CHAPTERS, AKN_NS)
         assert len(chapters) >= 4, f"Expected >=4 chapters, got {len(chapters)}"
 
 
@@ -60,30 +97,29 @@ class TestAknWellFormedness:
 class TestAknArt55:
     """Art. 55 AKN entry has all 5 paragraphs with bilingual content."""
 
-    def test_art55_exists(self, root: ET.Element) -> None:
-        art = root.find(".//akn:article[@eId='art_55']", NS)
-        assert art is not None, "Art. 55 missing from AKN XML"
+    def test_art55_exists(self, articles: dict[str, ET.Element]) -> None:
+        assert "art_55" in articles, "Art. 55 missing from AKN XML"
 
-    def test_art55_has_five_paragraphs(self, root: ET.Element) -> None:
-        art = root.find(".//akn:article[@eId='art_55']", NS)
+    def test_art55_has_five_paragraphs(self, articles: dict[str, ET.Element]) -> None:
+        art = articles.get("art_55")
         assert art is not None
-        paragraphs = art.findall("akn:paragraph", NS)
+        paragraphs = art.findall(PARAGRAPHS, AKN_NS)
         assert len(paragraphs) == 5, f"Expected 5 paragraphs, got {len(paragraphs)}"
 
-    def test_art55_paragraph_eids(self, root: ET.Element) -> None:
-        art = root.find(".//akn:article[@eId='art_55']", NS)
+    def test_art55_paragraph_eids(self, articles: dict[str, ET.Element]) -> None:
+        art = articles.get("art_55")
         assert art is not None
-        eids = [p.get("eId") for p in art.findall("akn:paragraph", NS)]
+        eids = [p.get("eId") for p in art.findall(PARAGRAPHS, AKN_NS)]
         expected = [f"art_55__para_{i}" for i in range(1, 6)]
         assert eids == expected
 
-    def test_art55_bilingual(self, root: ET.Element) -> None:
-        art = root.find(".//akn:article[@eId='art_55']", NS)
+    def test_art55_bilingual(self, articles: dict[str, ET.Element]) -> None:
+        art = articles.get("art_55")
         assert art is not None
-        for para in art.findall("akn:paragraph", NS):
-            ps = para.findall(".//akn:p", NS)
-            polish = [p for p in ps if p.get("{http://www.w3.org/XML/1998/namespace}lang") is None]
-            english = [p for p in ps if p.get("{http://www.w3.org/XML/1998/namespace}lang") == "en"]
+        for para in art.findall(PARAGRAPHS, AKN_NS):
+            ps = para.findall(PARAGRAPH_TEXT, AKN_NS)
+            polish = [p for p in ps if p.get(XML_LANG) is None]
+            english = [p for p in ps if p.get(XML_LANG) == "en"]
             eid = para.get("eId")
             assert len(polish) >= 1, f"{eid}: missing Polish text"
             assert len(english) >= 1, f"{eid}: missing English translation"
@@ -97,32 +133,11 @@ class TestAknArt55:
 class TestAknBilingualConvention:
     """Articles with code implementations should have bilingual text."""
 
-    KNOWN_MISSING_ENGLISH: ClassVar[set[str]] = {
-        "art_4",
-        "art_8",
-        "art_121",
-        "art_230",
-        "art_232",
-    }
-
-    def test_articles_have_english_translation(self, root: ET.Element) -> None:
-        articles = root.findall(".//akn:article", NS)
-        missing: list[str] = []
-        for art in articles:
-            eid = art.get("eId", "")
-            if eid in self.KNOWN_MISSING_ENGLISH:
-                continue
-            english = art.findall(".//*[@xml:lang='en']", {"xml": "http://www.w3.org/XML/1998/namespace"})
-            # Try alternate xpath approach
-            if not english:
-                english = [
-                    p
-                    for p in art.iter(f"{{{NS['akn']}}}p")
-                    if p.get("{http://www.w3.org/XML/1998/namespace}lang") == "en"
-                ]
-            if not english:
-                missing.append(eid)
-        assert not missing, f"Articles missing English translations: {missing}"
+    def test_articles_have_english_translation(self, articles: dict[str, ET.Element]) -> None:
+        missing = {
+            eid for eid, art in articles.items() if art.find(ENGLISH_TEXT, XML_NS) is None
+        } - KNOWN_MISSING_ENGLISH
+        assert not missing, f"Articles missing English translations: {sorted(missing)}"
 
 
 # ---------------------------------------------------------------------------
@@ -133,38 +148,15 @@ class TestAknBilingualConvention:
 class TestAknCodeCrossReference:
     """Every article referenced in Python raises should have an AKN entry."""
 
-    def test_code_articles_in_akn(self, root: ET.Element) -> None:
-        src_dir = Path(__file__).resolve().parent.parent / "src" / "konstytucja"
-        article_re = re.compile(r'article="(\d+)')
-        code_articles: set[int] = set()
-        for py_file in src_dir.rglob("*.py"):
-            for line in py_file.read_text(encoding="utf-8").splitlines():
-                for m in article_re.finditer(line):
-                    code_articles.add(int(m.group(1)))
-
-        akn_articles: set[int] = set()
-        for art in root.findall(".//akn:article", NS):
-            eid = art.get("eId", "")
-            m = re.match(r"art_(\d+)", eid)
-            if m:
-                akn_articles.add(int(m.group(1)))
-
-        # Articles referenced in code but not yet in AKN XML.
-        # As AKN coverage grows, remove from this set.
-        known_missing = {
-            103, 105,   # chapter 04: Sejm/Senate incompatibility, immunity
-            119,        # chapter 04: legislative process
-            125,        # chapter 04: referendum
-            147, 154, 155, 156, 158, 159, 160,  # chapter 06: Council of Ministers
-            164, 169, 171,  # chapter 07: local government
-            176, 178, 179, 190, 191, 198, 199,  # chapter 08: courts
-            205, 209, 214,  # chapter 09: oversight bodies
-            227,        # chapter 10: central bank
-            233,        # chapter 11: emergency
+    def test_code_articles_in_akn(
+        self, articles: dict[str, ET.Element], code_articles: frozenset[int]
+    ) -> None:
+        akn_articles = {
+            int(eid[4:]) for eid in articles if eid.startswith("art_") and eid[4:].isdigit()
         }
 
-        actually_missing = code_articles - akn_articles - known_missing
+        actually_missing = code_articles.difference(akn_articles, KNOWN_MISSING_AKN)
         assert not actually_missing, (
-            f"Articles in code but not in AKN XML (and not in known_missing): "
+            f"Articles in code but not in AKN XML (and not listed as known missing): "
             f"{sorted(actually_missing)}"
         )
@@ -32,6 +32,11 @@ class TestBranches:
         for branch in Branch:
             assert len(organs_for_branch(branch)) >= 2
 
+    def test_branch_is_its_polish_name(self):
+        assert Branch.LEGISLATIVE == "władza ustawodawcza"
+        assert Branch("władza sądownicza") is Branch.JUDICIAL
+        assert f"{Branch.EXECUTIVE}" == "władza wykonawcza"
+
 
 class TestStateOrgans:
     """State organs mapped to branches."""
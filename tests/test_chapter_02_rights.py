@@ -1,11 +1,45 @@
 """Tests for Chapter II: Rights and Freedoms (Art. 30–86)."""
 
+import re
+from dataclasses import replace
+
 import pytest
 
-from konstytucja.chapter_02_rights import validate_extradition, validate_rights_restriction
+from konstytucja.chapter_02_rights import (
+    validate_extradition,
+    validate_extradition_batch,
+    validate_rights_restriction,
+    validate_rights_restriction_batch,
+)
 from konstytucja.common.errors import ExtraditionError, RightsRestrictionError
 from konstytucja.common.types import ExtraditionRequest, RightsRestriction
 
+# Art. 55 denial messages, matched by the extradition tests and _PRECEDENCE_CASES.
+_COURT = re.compile("court")
+_HUMAN_RIGHTS = re.compile("human rights")
+_PROHIBITED = re.compile("prohibited")
+_POLITICAL = re.compile("political")
+
+
+# Art. 31(3): a restriction meeting every condition, and the message each
+# condition produces when it alone is not met.
+_ALL_CONDITIONS_MET = RightsRestriction(
+    description="Restriction under review",
+    by_statute=True,
+    necessary_in_democratic_state=True,
+    legitimate_aim=True,
+    proportionate=True,
+    preserves_essence=True,
+)
+
+_ART_31_3_SINGLE_FAILURES = (
+    ("by_statute", "not established by statute"),
+    ("necessary_in_democratic_state", "not necessary"),
+    ("legitimate_aim", "legitimate aim"),
+    ("proportionate", "not proportionate"),
+    ("preserves_essence", "violates the essence"),
+)
+
 
 class TestArt31ProportionalityTest:
     """Art. 31(3): Five cumulative conditions for restricting rights."""
@@ -17,69 +51,24 @@ class TestArt31ProportionalityTest:
         with pytest.raises(RightsRestrictionError) as exc_info:
             validate_rights_restriction(invalid_restriction)
         msg = str(exc_info.value)
-        assert "not necessary in a democratic state" in msg
-        assert "not proportionate" in msg
-        assert "violates the essence" in msg
-
-    def test_not_by_statute(self):
-        r = RightsRestriction(
-            description="Executive order restricting movement",
-            by_statute=False,
-            necessary_in_democratic_state=True,
-            legitimate_aim=True,
-            proportionate=True,
-            preserves_essence=True,
-        )
-        with pytest.raises(RightsRestrictionError, match="not established by statute"):
-            validate_rights_restriction(r)
-
-    def test_not_necessary(self):
-        r = RightsRestriction(
-            description="Unnecessary surveillance",
-            by_statute=True,
-            necessary_in_democratic_state=False,
-            legitimate_aim=True,
-            proportionate=True,
-            preserves_essence=True,
-        )
-        with pytest.raises(RightsRestrictionError, match="not necessary"):
-            validate_rights_restriction(r)
-
-    def test_no_legitimate_aim(self):
-        r = RightsRestriction(
-            description="Restriction for political convenience",
-            by_statute=True,
-            necessary_in_democratic_state=True,
-            legitimate_aim=False,
-            proportionate=True,
-            preserves_essence=True,
-        )
-        with pytest.raises(RightsRestrictionError, match="legitimate aim"):
-            validate_rights_restriction(r)
-
-    def test_not_proportionate(self):
-        r = RightsRestriction(
-            description="Disproportionate penalty",
-            by_statute=True,
-            necessary_in_democratic_state=True,
-            legitimate_aim=True,
-            proportionate=False,
-            preserves_essence=True,
-        )
-        with pytest.raises(RightsRestrictionError, match="not proportionate"):
-            validate_rights_restriction(r)
-
-    def test_violates_essence(self):
-        r = RightsRestriction(
-            description="Total elimination of right to privacy",
-            by_statute=True,
-            necessary_in_democratic_state=True,
-            legitimate_aim=True,
-            proportionate=True,
-            preserves_essence=False,
+        expected = (
+            "not necessary in a democratic state",
+            "not proportionate",
+            "violates the essence",
         )
-        with pytest.raises(RightsRestrictionError, match="violates the essence"):
+        missing = [s for s in expected if s not in msg]
+        assert not missing, missing
+
+    @pytest.mark.parametrize(
+        ("condition", "match"),
+        _ART_31_3_SINGLE_FAILURES,
+        ids=[condition for condition, _ in _ART_31_3_SINGLE_FAILURES],
+    )
+    def test_single_condition_failure(self, condition, match):
+        r = replace(_ALL_CONDITIONS_MET, **{condition: False})
+        with pytest.raises(RightsRestrictionError, match=match) as exc_info:
             validate_rights_restriction(r)
+        assert exc_info.value.article == "31(3)"
 
     def test_multiple_failures_reported(self):
         r = RightsRestriction(
@@ -93,11 +82,41 @@ class TestArt31ProportionalityTest:
         with pytest.raises(RightsRestrictionError) as exc_info:
             validate_rights_restriction(r)
         msg = str(exc_info.value)
-        assert "not established by statute" in msg
-        assert "not necessary" in msg
-        assert "legitimate aim" in msg
-        assert "not proportionate" in msg
-        assert "violates the essence" in msg
+        missing = [s for _, s in _ART_31_3_SINGLE_FAILURES if s not in msg]
+        assert not missing, missing
+
+    def test_conditions_read_by_truthiness(self):
+        """Non-bool values count as met or unmet, as in an if statement."""
+        assert validate_rights_restriction(replace(_ALL_CONDITIONS_MET, by_statute=2)) is True
+        with pytest.raises(RightsRestrictionError, match="not established by statute"):
+            validate_rights_restriction(replace(_ALL_CONDITIONS_MET, by_statute=None))
+
+
+class TestArt31BatchValidation:
+    """Art. 31(3): Batch screening returns the failed conditions per restriction."""
+
+    def test_all_valid_batch(self, valid_restriction):
+        assert validate_rights_restriction_batch([valid_restriction] * 3) == [None] * 3
+
+    def test_empty_batch(self):
+        assert validate_rights_restriction_batch([]) == []
+
+    def test_reports_only_failing_restrictions(self, valid_restriction, invalid_restriction):
+        results = validate_rights_restriction_batch(
+            [valid_restriction, invalid_restriction, valid_restriction]
+        )
+        assert results[0] is None
+        assert results[2] is None
+        assert "not necessary" in results[1]
+
+    def test_failure_reasons_match_scalar_validator(self, invalid_restriction):
+        with pytest.raises(RightsRestrictionError) as scalar_info:
+            validate_rights_restriction(invalid_restriction)
+        (batch_detail,) = validate_rights_restriction_batch([invalid_restriction])
+        assert str(scalar_info.value).endswith(f"fails Art. 31(3): {batch_detail}")
+
+    def test_accepts_generator(self, valid_restriction):
+        assert validate_rights_restriction_batch(r for r in [valid_restriction]) == [None]
 
 
 # ---------------------------------------------------------------------------
@@ -105,77 +124,82 @@ class TestArt31ProportionalityTest:
 # ---------------------------------------------------------------------------
 
 
+# Art. 55: court-approved requests from which each test varies a few fields.
+_NON_CITIZEN = ExtraditionRequest(
+    subject_is_polish_citizen=False,
+    requesting_state_or_body="Germany",
+    court_approved=True,
+)
+# Art. 55(2): European Arrest Warrant for a Polish citizen meeting both conditions.
+_CITIZEN_EAW = replace(
+    _NON_CITIZEN,
+    subject_is_polish_citizen=True,
+    based_on_ratified_treaty=True,
+    act_committed_abroad=True,
+    double_criminality=True,
+)
+# Art. 55(3): ICC request for genocide, without the Art. 55(2) conditions.
+_ICC_GENOCIDE = replace(
+    _NON_CITIZEN,
+    subject_is_polish_citizen=True,
+    requesting_state_or_body="International Criminal Court",
+    based_on_ratified_treaty=True,
+    international_judicial_body=True,
+    genocide_or_war_crime=True,
+)
+
+# Art. 55: requests denied on a single rule, with the article and message cited.
+_PRECEDENCE_CASES = [
+    pytest.param(
+        replace(_NON_CITIZEN, subject_is_polish_citizen=True),
+        "55(1)", _PROHIBITED, id="citizen-without-treaty",
+    ),
+    pytest.param(
+        replace(_ICC_GENOCIDE, based_on_ratified_treaty=False),
+        "55(1)", _PROHIBITED, id="icc-without-treaty",
+    ),
+    pytest.param(
+        replace(_NON_CITIZEN, court_approved=False),
+        "55(5)", _COURT, id="no-court-approval",
+    ),
+    pytest.param(
+        replace(_NON_CITIZEN, subject_is_polish_citizen=True, court_approved=False),
+        "55(5)", _COURT, id="court-before-citizen-rules",
+    ),
+    pytest.param(
+        replace(_NON_CITIZEN, political_nonviolent_offense=True, court_approved=False),
+        "55(4)", _POLITICAL, id="absolute-prohibition-before-court",
+    ),
+]
+
+
+@pytest.mark.extradition
 class TestArt55Extradition:
     """Art. 55 [2006 amendment]: Extradition rules."""
 
     def test_non_citizen_allowed(self):
         """Non-Polish citizens may be extradited (no Art. 55(1) protection)."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=False,
-            requesting_state_or_body="Germany",
-            court_approved=True,
-        )
-        assert validate_extradition(req) is True
-
-    def test_polish_citizen_blocked_by_default(self):
-        """Art. 55(1): Extradition of a Polish citizen is prohibited by default."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="Germany",
-            court_approved=True,
-        )
-        with pytest.raises(ExtraditionError, match="prohibited") as exc_info:
-            validate_extradition(req)
-        assert exc_info.value.article == "55(1)"
+        assert validate_extradition(_NON_CITIZEN) is True
 
     def test_polish_citizen_eaw_allowed(self):
         """Art. 55(2): Polish citizen extradited under EAW/treaty if conditions met."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="Germany",
-            based_on_ratified_treaty=True,
-            act_committed_abroad=True,
-            double_criminality=True,
-            court_approved=True,
-        )
-        assert validate_extradition(req) is True
+        assert validate_extradition(_CITIZEN_EAW) is True
 
     def test_polish_citizen_eaw_missing_abroad(self):
         """Art. 55(2)(1): Act must be committed outside Poland."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="Germany",
-            based_on_ratified_treaty=True,
-            act_committed_abroad=False,
-            double_criminality=True,
-            court_approved=True,
-        )
+        req = replace(_CITIZEN_EAW, act_committed_abroad=False)
         with pytest.raises(ExtraditionError, match="outside Polish territory"):
             validate_extradition(req)
 
     def test_polish_citizen_eaw_missing_double_criminality(self):
         """Art. 55(2)(2): Double criminality required."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="France",
-            based_on_ratified_treaty=True,
-            act_committed_abroad=True,
-            double_criminality=False,
-            court_approved=True,
-        )
+        req = replace(_CITIZEN_EAW, double_criminality=False)
         with pytest.raises(ExtraditionError, match="Polish law"):
             validate_extradition(req)
 
     def test_polish_citizen_eaw_both_conditions_missing(self):
         """Art. 55(2): Both conditions (1) and (2) reported when missing."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="Spain",
-            based_on_ratified_treaty=True,
-            act_committed_abroad=False,
-            double_criminality=False,
-            court_approved=True,
-        )
+        req = replace(_CITIZEN_EAW, act_committed_abroad=False, double_criminality=False)
         with pytest.raises(ExtraditionError) as exc_info:
             validate_extradition(req)
         msg = str(exc_info.value)
@@ -185,155 +209,133 @@ class TestArt55Extradition:
 
     def test_icc_genocide_bypasses_conditions(self):
         """Art. 55(3): ICC request for genocide bypasses Art. 55(2) conditions."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="International Criminal Court",
-            based_on_ratified_treaty=True,
-            international_judicial_body=True,
-            genocide_or_war_crime=True,
-            act_committed_abroad=False,   # not required for Art. 55(3)
-            double_criminality=False,     # not required for Art. 55(3)
-            court_approved=True,
-        )
-        assert validate_extradition(req) is True
+        assert not _ICC_GENOCIDE.act_committed_abroad
+        assert not _ICC_GENOCIDE.double_criminality
+        assert validate_extradition(_ICC_GENOCIDE) is True
 
     def test_icc_non_genocide_falls_through(self):
         """Art. 55(3) only applies to genocide/war crimes/aggression."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="International Criminal Court",
-            based_on_ratified_treaty=True,
-            international_judicial_body=True,
-            genocide_or_war_crime=False,
-            act_committed_abroad=False,
-            double_criminality=False,
-            court_approved=True,
-        )
+        req = replace(_ICC_GENOCIDE, genocide_or_war_crime=False)
         with pytest.raises(ExtraditionError):
             validate_extradition(req)
 
-    def test_icc_without_treaty_falls_through(self):
-        """Art. 55(3) requires treaty basis even for ICC."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="International Criminal Court",
-            based_on_ratified_treaty=False,
-            international_judicial_body=True,
-            genocide_or_war_crime=True,
-            court_approved=True,
-        )
-        with pytest.raises(ExtraditionError, match="prohibited"):
-            validate_extradition(req)
-
     def test_political_nonviolent_blocked(self):
         """Art. 55(4): Political nonviolent offence — absolute prohibition."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=False,
-            requesting_state_or_body="Belarus",
-            political_nonviolent_offense=True,
-            court_approved=True,
-        )
-        with pytest.raises(ExtraditionError, match="political") as exc_info:
+        req = replace(_NON_CITIZEN, political_nonviolent_offense=True)
+        with pytest.raises(ExtraditionError, match=_POLITICAL) as exc_info:
             validate_extradition(req)
         assert exc_info.value.article == "55(4)"
 
     def test_human_rights_violation_blocked(self):
         """Art. 55(4): Extradition violating human rights — absolute prohibition."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=False,
-            requesting_state_or_body="Country X",
-            violates_human_rights=True,
-            court_approved=True,
-        )
-        with pytest.raises(ExtraditionError, match="human rights") as exc_info:
+        req = replace(_NON_CITIZEN, violates_human_rights=True)
+        with pytest.raises(ExtraditionError, match=_HUMAN_RIGHTS) as exc_info:
             validate_extradition(req)
         assert exc_info.value.article == "55(4)"
 
     def test_political_blocks_even_with_treaty(self):
         """Art. 55(4) takes precedence over Art. 55(2) treaty-based extradition."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="Some State",
-            based_on_ratified_treaty=True,
-            act_committed_abroad=True,
-            double_criminality=True,
-            political_nonviolent_offense=True,
-            court_approved=True,
-        )
-        with pytest.raises(ExtraditionError, match="political"):
+        req = replace(_CITIZEN_EAW, political_nonviolent_offense=True)
+        with pytest.raises(ExtraditionError, match=_POLITICAL):
             validate_extradition(req)
 
-    def test_court_approval_required(self):
-        """Art. 55(5): Court must approve admissibility."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=False,
-            requesting_state_or_body="Germany",
-            court_approved=False,
-        )
-        with pytest.raises(ExtraditionError, match="court") as exc_info:
-            validate_extradition(req)
-        assert exc_info.value.article == "55(5)"
-
-    def test_court_approval_checked_before_citizen_rules(self):
-        """Art. 55(5) is checked even for non-citizens."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=False,
-            requesting_state_or_body="Germany",
-            court_approved=False,
-        )
-        with pytest.raises(ExtraditionError) as exc_info:
-            validate_extradition(req)
-        assert exc_info.value.article == "55(5)"
-
-    def test_art55_4_checked_before_court(self):
-        """Art. 55(4) absolute prohibitions are checked before Art. 55(5) court."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=False,
-            requesting_state_or_body="Country X",
-            political_nonviolent_offense=True,
-            court_approved=False,
-        )
-        with pytest.raises(ExtraditionError) as exc_info:
-            validate_extradition(req)
-        # Art. 55(4) should fire first, not 55(5)
-        assert exc_info.value.article == "55(4)"
-
     def test_human_rights_blocks_even_with_treaty(self):
         """Art. 55(4) human-rights prohibition overrides treaty-based extradition."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="Some State",
-            based_on_ratified_treaty=True,
-            act_committed_abroad=True,
-            double_criminality=True,
-            violates_human_rights=True,
-            court_approved=True,
-        )
-        with pytest.raises(ExtraditionError, match="human rights") as exc_info:
+        req = replace(_CITIZEN_EAW, violates_human_rights=True)
+        with pytest.raises(ExtraditionError, match=_HUMAN_RIGHTS) as exc_info:
             validate_extradition(req)
         assert exc_info.value.article == "55(4)"
 
     def test_icc_genocide_blocked_by_human_rights(self):
         """Art. 55(4) blocks even ICC genocide requests that violate human rights."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=True,
-            requesting_state_or_body="International Criminal Court",
-            based_on_ratified_treaty=True,
-            international_judicial_body=True,
-            genocide_or_war_crime=True,
-            violates_human_rights=True,
-            court_approved=True,
-        )
-        with pytest.raises(ExtraditionError, match="human rights") as exc_info:
+        req = replace(_ICC_GENOCIDE, violates_human_rights=True)
+        with pytest.raises(ExtraditionError, match=_HUMAN_RIGHTS) as exc_info:
             validate_extradition(req)
         assert exc_info.value.article == "55(4)"
 
+    @pytest.mark.parametrize(("req", "article", "match"), _PRECEDENCE_CASES)
+    def test_first_violated_rule_is_cited(self, req, article, match):
+        """Rules are checked in order: Art. 55(4), then 55(5), then 55(1)–(3)."""
+        with pytest.raises(ExtraditionError, match=match) as exc_info:
+            validate_extradition(req)
+        assert exc_info.value.article == article
+
     def test_non_citizen_no_treaty_needed(self):
         """Non-citizens can be extradited without treaty basis (Art. 55(1) is citizen-only)."""
-        req = ExtraditionRequest(
-            subject_is_polish_citizen=False,
-            requesting_state_or_body="Country Y",
-            based_on_ratified_treaty=False,
-            court_approved=True,
+        assert not _NON_CITIZEN.based_on_ratified_treaty
+        assert validate_extradition(_NON_CITIZEN) is True
+
+    def test_request_fields_read_by_truthiness(self):
+        """Non-bool values count as set or unset, as in an if statement."""
+        with pytest.raises(ExtraditionError, match=_POLITICAL):
+            validate_extradition(replace(_NON_CITIZEN, political_nonviolent_offense=2))
+        with pytest.raises(ExtraditionError) as exc_info:
+            validate_extradition(replace(_NON_CITIZEN, court_approved=None))
+        assert exc_info.value.article == "55(5)"
+
+
+@pytest.mark.extradition
+class TestArt55ExtraditionBatch:
+    """Art. 55: Batch screening returns the violated article per request."""
+
+    def test_reports_article_per_request(self):
+        requests = [
+            ExtraditionRequest(
+                subject_is_polish_citizen=False,
+                requesting_state_or_body="Germany",
+                court_approved=True,
+            ),
+            ExtraditionRequest(
+                subject_is_polish_citizen=False,
+                requesting_state_or_body="Belarus",
+                political_nonviolent_offense=True,
+                court_approved=True,
+            ),
+            ExtraditionRequest(
+                subject_is_polish_citizen=True,
+                requesting_state_or_body="Germany",
+                court_approved=True,
+            ),
+            ExtraditionRequest(
+                subject_is_polish_citizen=True,
+                requesting_state_or_body="Spain",
+                based_on_ratified_treaty=True,
+                court_approved=True,
+            ),
+            ExtraditionRequest(
+                subject_is_polish_citizen=False,
+                requesting_state_or_body="Germany",
+            ),
+        ]
+        assert validate_extradition_batch(requests) == [None, "55(4)", "55(1)", "55(2)", "55(5)"]
+
+    def test_empty_batch(self):
+        assert validate_extradition_batch([]) == []
+
+    def test_agrees_with_scalar_validator(self):
+        """Every combination of the nine flags gets the same verdict as the scalar path."""
+        fields = (
+            "subject_is_polish_citizen",
+            "based_on_ratified_treaty",
+            "international_judicial_body",
+            "act_committed_abroad",
+            "double_criminality",
+            "political_nonviolent_offense",
+            "violates_human_rights",
+            "court_approved",
+            "genocide_or_war_crime",
         )
-        assert validate_extradition(req) is True
+        requests = [
+            ExtraditionRequest(
+                requesting_state_or_body="Any",
+                **{f: bool(bits >> i & 1) for i, f in enumerate(fields)},
+            )
+            for bits in range(1 << len(fields))
+        ]
+        for req, article in zip(requests, validate_extradition_batch(requests), strict=True):
+            if article is None:
+                assert validate_extradition(req) is True
+            else:
+                with pytest.raises(ExtraditionError) as exc_info:
+                    validate_extradition(req)
+                assert exc_info.value.article == article
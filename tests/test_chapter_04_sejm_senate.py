@@ -1,6 +1,7 @@
 """Tests for Chapter IV: Sejm and Senate (Art. 95–125)."""
 
-from datetime import date
+import re
+from datetime import date, timedelta
 
 import pytest
 
@@ -11,12 +12,15 @@ from konstytucja.chapter_04_sejm_senate import (
     SENATE_SENATORS,
     check_incompatibility,
     check_sejm_eligibility,
+    check_sejm_eligibility_batch,
     check_senate_eligibility,
+    check_senate_eligibility_batch,
     sejm_overrides_senate,
     sejm_passes_bill,
     senate_passes_bill,
     validate_parliamentary_immunity,
     validate_referendum,
+    validate_referendum_batch,
 )
 from konstytucja.common.errors import (
     EligibilityError,
@@ -28,6 +32,16 @@ from konstytucja.common.errors import (
 )
 from konstytucja.common.types import Chamber, Citizen, VoteRecord
 
+# Art. 99 eligibility and Art. 125 referendum messages, each matched by several tests.
+_NOT_POLISH_CITIZEN = re.compile("Polish citizen")
+_CRIMINAL_RECORD = re.compile("intentional crime")
+_LOW_TURNOUT = re.compile("turnout")
+_REJECTED = re.compile("rejected")
+
+
+# Stable, shell-friendly test ids for the Art. 103 office parametrization.
+_INCOMPATIBLE_IDS = [o.replace("'", "").replace(" ", "_") for o in INCOMPATIBLE_WITH_DEPUTY]
+
 
 class TestSejmEligibility:
     """Art. 99(1): Sejm eligibility — 21 years, Polish citizen."""
@@ -40,11 +54,11 @@ class TestSejmEligibility:
             check_sejm_eligibility(young_citizen, election_date)
 
     def test_non_citizen(self, foreign_citizen, election_date):
-        with pytest.raises(EligibilityError, match="Polish citizen"):
+        with pytest.raises(EligibilityError, match=_NOT_POLISH_CITIZEN):
             check_sejm_eligibility(foreign_citizen, election_date)
 
     def test_criminal_record(self, convicted_citizen, election_date):
-        with pytest.raises(EligibilityError, match="intentional crime"):
+        with pytest.raises(EligibilityError, match=_CRIMINAL_RECORD):
             check_sejm_eligibility(convicted_citizen, election_date)
 
     def test_criminal_record_references_2009_amendment(self, convicted_citizen, election_date):
@@ -55,22 +69,15 @@ class TestSejmEligibility:
         assert "nowelizacja 2009" in msg
         assert "ex officio" in msg
 
-    def test_exactly_21_on_election_day(self):
-        citizen = Citizen(
-            name="Exact 21",
-            date_of_birth=date(2004, 10, 15),
-            polish_citizen=True,
-        )
-        assert check_sejm_eligibility(citizen, date(2025, 10, 15)) is True
-
-    def test_day_before_21(self):
-        citizen = Citizen(
-            name="Almost 21",
-            date_of_birth=date(2004, 10, 16),
-            polish_citizen=True,
-        )
+    def test_exactly_21_on_election_day(self, election_date, birthday_on_election_day):
+        citizen = Citizen(name="Exact 21", date_of_birth=birthday_on_election_day(21))
+        assert check_sejm_eligibility(citizen, election_date) is True
+
+    def test_day_before_21(self, election_date, birthday_on_election_day):
+        born = birthday_on_election_day(21) + timedelta(days=1)
+        citizen = Citizen(name="Almost 21", date_of_birth=born)
         with pytest.raises(EligibilityError):
-            check_sejm_eligibility(citizen, date(2025, 10, 15))
+            check_sejm_eligibility(citizen, election_date)
 
 
 class TestSenateEligibility:
@@ -79,31 +86,79 @@ class TestSenateEligibility:
     def test_eligible(self, adult_citizen, election_date):
         assert check_senate_eligibility(adult_citizen, election_date) is True
 
-    def test_too_young_for_senate(self):
-        citizen = Citizen(
-            name="Young Senator",
-            date_of_birth=date(1996, 1, 1),
-            polish_citizen=True,
-        )
+    def test_too_young_for_senate(self, election_date):
+        citizen = Citizen(name="Young Senator", date_of_birth=date(1996, 1, 1))
         with pytest.raises(EligibilityError, match="at least 30"):
-            check_senate_eligibility(citizen, date(2025, 10, 15))
+            check_senate_eligibility(citizen, election_date)
 
     def test_non_citizen(self, foreign_citizen, election_date):
-        with pytest.raises(EligibilityError, match="Polish citizen"):
+        with pytest.raises(EligibilityError, match=_NOT_POLISH_CITIZEN):
             check_senate_eligibility(foreign_citizen, election_date)
 
     def test_criminal_record(self, convicted_citizen, election_date):
         """Art. 99(3) [nowelizacja 2009]: Senate candidate cannot have criminal record."""
-        with pytest.raises(EligibilityError, match="intentional crime"):
+        with pytest.raises(EligibilityError, match=_CRIMINAL_RECORD):
             check_senate_eligibility(convicted_citizen, election_date)
 
-    def test_exactly_30(self):
-        citizen = Citizen(
-            name="Exact 30",
-            date_of_birth=date(1995, 10, 15),
-            polish_citizen=True,
-        )
-        assert check_senate_eligibility(citizen, date(2025, 10, 15)) is True
+    def test_exactly_30(self, election_date, birthday_on_election_day):
+        citizen = Citizen(name="Exact 30", date_of_birth=birthday_on_election_day(30))
+        assert check_senate_eligibility(citizen, election_date) is True
+
+
+class TestEligibilityBatch:
+    """Art. 99: Batch screening agrees with the per-candidate checks."""
+
+    def test_sejm_batch(
+        self, adult_citizen, young_citizen, foreign_citizen, convicted_citizen, election_date
+    ):
+        citizens = [adult_citizen, young_citizen, foreign_citizen, convicted_citizen]
+        expected = [True, False, False, False]
+        assert check_sejm_eligibility_batch(citizens, election_date) == expected
+
+    def test_senate_batch_age_boundary(self, election_date, birthday_on_election_day):
+        born = birthday_on_election_day(30)
+        citizens = [
+            Citizen(name="Exact 30", date_of_birth=born),
+            Citizen(name="Almost 30", date_of_birth=born + timedelta(days=1)),
+        ]
+        assert check_senate_eligibility_batch(citizens, election_date) == [True, False]
+
+    def test_empty_batch(self, election_date):
+        assert check_sejm_eligibility_batch([], election_date) == []
+
+    @pytest.mark.parametrize(
+        ("born", "election"),
+        [
+            (date(2004, 2, 29), date(2025, 2, 28)),
+            (date(2004, 2, 29), date(2025, 3, 1)),
+            (date(2003, 2, 28), date(2024, 2, 29)),
+            (date(2003, 3, 1), date(2024, 2, 29)),
+            (date(2004, 10, 15), date(2025, 10, 15)),
+            (date(2004, 10, 16), date(2025, 10, 15)),
+        ],
+    )
+    def test_sejm_batch_matches_scalar_on_leap_days(self, born, election):
+        citizen = Citizen(name="Leap", date_of_birth=born)
+        try:
+            expected = check_sejm_eligibility(citizen, election)
+        except EligibilityError:
+            expected = False
+        assert check_sejm_eligibility_batch([citizen], election) == [expected]
+
+
+# Art. 121(3): an absolute majority needs more than 230 of the 460 statutory deputies.
+_SENATE_OVERRIDE_CASES = [
+    pytest.param(
+        VoteRecord(chamber=Chamber.SEJM, votes_for=231, votes_against=100, votes_abstain=50),
+        None,
+        id="231-of-460",
+    ),
+    pytest.param(
+        VoteRecord(chamber=Chamber.SEJM, votes_for=230, votes_against=100, votes_abstain=50),
+        "Absolute majority",
+        id="230-of-460",
+    ),
+]
 
 
 class TestBillPassage:
@@ -122,16 +177,13 @@ class TestBillPassage:
     def test_sejm_overrides_senate(self, sejm_absolute_majority):
         assert sejm_overrides_senate(sejm_absolute_majority) is True
 
-    def test_sejm_fails_to_override(self):
-        """230 votes is not > 230 (absolute majority needs > half)."""
-        vote = VoteRecord(
-            chamber=Chamber.SEJM,
-            votes_for=230,
-            votes_against=100,
-            votes_abstain=50,
-        )
-        with pytest.raises(MajorityError):
-            sejm_overrides_senate(vote)
+    @pytest.mark.parametrize(("vote", "error"), _SENATE_OVERRIDE_CASES)
+    def test_sejm_override_threshold(self, vote, error):
+        if error is None:
+            assert sejm_overrides_senate(vote) is True
+        else:
+            with pytest.raises(MajorityError, match=error):
+                sejm_overrides_senate(vote)
 
 
 # ---------------------------------------------------------------------------
@@ -167,11 +219,18 @@ class TestIncompatibilitas:
         """Art. 103: Exception — Council of Ministers members may be deputies."""
         assert check_incompatibility("Minister of Finance") is True
 
-    @pytest.mark.parametrize("office", INCOMPATIBLE_WITH_DEPUTY)
+    @pytest.mark.parametrize("office", INCOMPATIBLE_WITH_DEPUTY, ids=_INCOMPATIBLE_IDS)
     def test_incompatible_offices_rejected(self, office):
         with pytest.raises(IncompatibilityError):
             check_incompatibility(office)
 
+    def test_office_list_has_no_duplicates(self):
+        assert len(set(INCOMPATIBLE_WITH_DEPUTY)) == len(INCOMPATIBLE_WITH_DEPUTY)
+
+    def test_office_names_matched_exactly(self):
+        """Lookup is by exact office name, not by substring or prefix."""
+        assert check_incompatibility("Senator of the Roman Republic") is True
+
     def test_nbp_president_incompatible(self):
         with pytest.raises(IncompatibilityError, match="cannot be held jointly"):
             check_incompatibility("President of the National Bank of Poland")
@@ -226,30 +285,47 @@ class TestReferendum:
         assert validate_referendum(600_000, 400_000, eligible_voters=1_000_000) is True
 
     def test_fails_insufficient_turnout(self):
-        with pytest.raises(ReferendumError, match="turnout"):
+        with pytest.raises(ReferendumError, match=_LOW_TURNOUT):
             validate_referendum(300_000, 100_000, eligible_voters=1_000_000)
 
     def test_fails_more_against_than_for(self):
-        with pytest.raises(ReferendumError, match="rejected"):
+        with pytest.raises(ReferendumError, match=_REJECTED):
             validate_referendum(400_000, 500_000, eligible_voters=1_000_000)
 
     def test_exact_50_percent_turnout_not_binding(self):
         """Exactly 50% is NOT binding — must exceed 50%."""
-        with pytest.raises(ReferendumError, match="turnout"):
+        with pytest.raises(ReferendumError, match=_LOW_TURNOUT):
             validate_referendum(300_000, 200_000, eligible_voters=1_000_000)
 
     def test_just_over_50_percent_turnout(self):
         assert validate_referendum(300_001, 200_000, eligible_voters=1_000_000) is True
 
+    def test_odd_electorate_turnout_boundary(self):
+        """With 7 eligible voters, 3 votes is not over half but 4 is."""
+        with pytest.raises(ReferendumError, match=_LOW_TURNOUT):
+            validate_referendum(2, 1, eligible_voters=7)
+        assert validate_referendum(3, 1, eligible_voters=7) is True
+
     def test_zero_eligible_voters_rejected(self):
         with pytest.raises(ReferendumError, match="positive"):
             validate_referendum(100, 50, eligible_voters=0)
 
     def test_tie_rejected(self):
-        with pytest.raises(ReferendumError, match="rejected"):
+        with pytest.raises(ReferendumError, match=_REJECTED):
             validate_referendum(500_000, 500_000, eligible_voters=1_000_000)
 
     def test_error_references_article_125(self):
         with pytest.raises(ReferendumError) as exc_info:
             validate_referendum(100, 200, eligible_voters=100)
         assert "125" in exc_info.value.article
+
+    def test_batch_scores_each_referendum(self):
+        assert validate_referendum_batch(
+            [600_000, 300_000, 400_000, 300_001, 3, 2, 100],
+            [400_000, 100_000, 500_000, 200_000, 1, 1, 50],
+            [1_000_000, 1_000_000, 1_000_000, 1_000_000, 7, 7, 0],
+        ) == [True, False, False, True, True, False, False]
+
+    def test_batch_requires_equal_lengths(self):
+        with pytest.raises(ValueError):
+            validate_referendum_batch([1, 2], [0], [3, 3])
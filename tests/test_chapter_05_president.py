@@ -24,11 +24,7 @@ class TestPresidentialEligibility:
         ) is True
 
     def test_too_young(self, election_date):
-        citizen = Citizen(
-            name="Young Candidate",
-            date_of_birth=date(1995, 1, 1),
-            polish_citizen=True,
-        )
+        citizen = Citizen(name="Young Candidate", date_of_birth=date(1995, 1, 1))
         with pytest.raises(EligibilityError, match="at least 35"):
             check_presidential_eligibility(citizen, election_date, signatures=100_000)
 
@@ -55,12 +51,8 @@ class TestPresidentialEligibility:
             adult_citizen, election_date, signatures=100_000,
         ) is True
 
-    def test_exactly_35_on_election_day(self, election_date):
-        citizen = Citizen(
-            name="Exact 35",
-            date_of_birth=date(1990, 10, 15),
-            polish_citizen=True,
-        )
+    def test_exactly_35_on_election_day(self, election_date, birthday_on_election_day):
+        citizen = Citizen(name="Exact 35", date_of_birth=birthday_on_election_day(35))
         assert check_presidential_eligibility(
             citizen, election_date, signatures=100_000,
         ) is True
@@ -75,10 +67,24 @@ class TestPresidentialEligibility:
         with pytest.raises(EligibilityError) as exc_info:
             check_presidential_eligibility(citizen, election_date, signatures=50)
         msg = str(exc_info.value)
-        assert "Polish citizen" in msg
-        assert "at least 35" in msg
-        assert "intentional crime" in msg
-        assert "signatures" in msg
+        expected = ("Polish citizen", "at least 35", "intentional crime", "signatures")
+        missing = [s for s in expected if s not in msg]
+        assert not missing, missing
+
+
+# Art. 122(5): overriding a veto needs three-fifths of the votes cast.
+_VETO_CASES = [
+    pytest.param(
+        VoteRecord(chamber=Chamber.SEJM, votes_for=276, votes_against=184),
+        None,
+        id="276-of-460-exactly-three-fifths",
+    ),
+    pytest.param(
+        VoteRecord(chamber=Chamber.SEJM, votes_for=275, votes_against=185),
+        "Three-fifths",
+        id="275-of-460-one-short",
+    ),
+]
 
 
 class TestVetoOverride:
@@ -87,23 +93,13 @@ class TestVetoOverride:
     def test_override_passes(self, sejm_three_fifths):
         assert sejm_overrides_veto(sejm_three_fifths) is True
 
-    def test_override_fails(self):
-        vote = VoteRecord(
-            chamber=Chamber.SEJM,
-            votes_for=275,
-            votes_against=185,
-        )
-        with pytest.raises(MajorityError, match="Three-fifths"):
-            sejm_overrides_veto(vote)
-
-    def test_override_exact_three_fifths(self):
-        """276 of 460 = 3/5 exactly."""
-        vote = VoteRecord(
-            chamber=Chamber.SEJM,
-            votes_for=276,
-            votes_against=184,
-        )
-        assert sejm_overrides_veto(vote) is True
+    @pytest.mark.parametrize(("vote", "error"), _VETO_CASES)
+    def test_override_threshold(self, vote, error):
+        if error is None:
+            assert sejm_overrides_veto(vote) is True
+        else:
+            with pytest.raises(MajorityError, match=error):
+                sejm_overrides_veto(vote)
 
 
 # ---------------------------------------------------------------------------
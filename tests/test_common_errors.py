@@ -0,0 +1,27 @@
+"""Tests for the constitutional error hierarchy."""
+
+import copy
+import pickle
+
+from konstytucja.common.errors import ConstitutionalError, ExtraditionError
+
+
+class TestConstitutionalError:
+    """Errors cite their article and survive pickle/copy intact."""
+
+    def test_message_prefixed_with_article(self):
+        err = ConstitutionalError("Rule violated.", article="55(4)")
+        assert str(err) == "Art. 55(4): Rule violated."
+
+    def test_no_prefix_without_article(self):
+        assert str(ConstitutionalError("Rule violated.")) == "Rule violated."
+
+    def test_error_survives_pickling(self):
+        """The slotted ``article`` attribute and the instance dict survive pickle/copy."""
+        err = ExtraditionError("Extradition is prohibited.", article="55(4)")
+        err.add_note("ctx")
+        for restored in (pickle.loads(pickle.dumps(err)), copy.copy(err)):
+            assert type(restored) is ExtraditionError
+            assert restored.article == "55(4)"
+            assert str(restored) == str(err)
+            assert restored.__notes__ == ["ctx"]
@@ -0,0 +1,48 @@
+"""Tests for the shared domain types."""
+
+from dataclasses import asdict
+from datetime import date
+
+import pytest
+
+from konstytucja.common.types import (
+    Chamber,
+    Citizen,
+    ExtraditionRequest,
+    RightsRestriction,
+    VoteRecord,
+    ages_at,
+)
+
+
+class TestCitizenAge:
+    """Citizen.age_at(), the age_on[date] lookup and ages_at() agree."""
+
+    def test_age_on_lookup_matches_age_at(self, adult_citizen, election_date):
+        assert adult_citizen.age_on[election_date] == adult_citizen.age_at(election_date) == 40
+
+    def test_age_on_lookup_is_shared(self, adult_citizen):
+        assert adult_citizen.age_on is adult_citizen.age_on
+
+    @pytest.mark.parametrize("on_date", [date(2025, 10, 15), date(2028, 2, 29)])
+    def test_ages_at_matches_age_at(self, on_date):
+        births = [date(1996, 2, 29), date(2004, 10, 15), date(2004, 10, 16), date(2007, 3, 1)]
+        expected = [Citizen(name="x", date_of_birth=b).age_at(on_date) for b in births]
+        assert ages_at(births, on_date) == expected
+
+
+class TestDataclassContract:
+    """Domain types are plain dataclasses: every field is an init argument."""
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            Citizen(name="Jan Kowalski", date_of_birth=date(1985, 3, 15)),
+            VoteRecord(chamber=Chamber.SEJM, votes_for=231, votes_against=100),
+            RightsRestriction(description="Quarantine", by_statute=True),
+            ExtraditionRequest(subject_is_polish_citizen=True, requesting_state_or_body="ICC"),
+        ],
+        ids=lambda obj: type(obj).__name__,
+    )
+    def test_asdict_round_trip(self, obj):
+        assert type(obj)(**asdict(obj)) == obj